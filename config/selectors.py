@@ -5,6 +5,26 @@ This module contains all selectors used to extract property information
 from the Orange County Tax Assessor website.
 """
 
+from typing import NamedTuple, Union
+
+
+class Selector(NamedTuple):
+    """A selector classified once at config load."""
+
+    kind: str  # "css" or "xpath"
+    value: str  # Playwright-ready selector string
+
+
+def CSS(selector: str) -> Selector:
+    """Wrap a CSS selector."""
+    return Selector("css", selector)
+
+
+def XP(selector: str) -> Selector:
+    """Wrap an XPath selector (prefixed for Playwright)."""
+    return Selector("xpath", f"xpath={selector}")
+
+
 # =======================
 # Orange County Selectors
 # =======================
@@ -12,148 +32,148 @@ from the Orange County Tax Assessor website.
 ORANGE_COUNTY_SELECTORS = {
     # Search Form Selectors
     "search_form": {
-        "owner_name_input": 'input[name="Query.OwnerName"]',
-        "parcel_id_input": 'input[name="Query.AccountNumber"]',
-        "address_input": 'input[name="Query.PropertyLocation"]',
-        "search_button": '#btn-search-submit',
-        "submit_button": 'button[type="submit"]',
+        "owner_name_input": CSS('input[name="Query.OwnerName"]'),
+        "parcel_id_input": CSS('input[name="Query.AccountNumber"]'),
+        "address_input": CSS('input[name="Query.PropertyLocation"]'),
+        "search_button": CSS('#btn-search-submit'),
+        "submit_button": CSS('button[type="submit"]'),
     },
 
     # Search Results Table
     "results_table": {
-        "table": "table.search-results",
-        "table_alt": "table#property-results",
-        "rows": "table.search-results tbody tr",
-        "rows_alt": "table#property-results tbody tr",
-        "no_results": "div.no-results",
-        "no_results_alt": "p:contains('No results found')",
+        "table": CSS("table.search-results"),
+        "table_alt": CSS("table#property-results"),
+        "rows": CSS("table.search-results tbody tr"),
+        "rows_alt": CSS("table#property-results tbody tr"),
+        "no_results": CSS("div.no-results"),
+        "no_results_alt": CSS("p:contains('No results found')"),
     },
 
     # Property Detail Page
     "property_details": {
         # Owner Information
         "owner_name": [
-            "div.owner-info h3",
-            "span.owner-name",
-            "td:contains('Owner Name') + td",
-            "//label[contains(text(), 'Owner')]/following-sibling::span",
+            CSS("div.owner-info h3"),
+            CSS("span.owner-name"),
+            CSS("td:contains('Owner Name') + td"),
+            XP("//label[contains(text(), 'Owner')]/following-sibling::span"),
         ],
 
         # Parcel Information
         "parcel_id": [
-            "span.parcel-id",
-            "td:contains('Parcel ID') + td",
-            "div.parcel-number",
-            "//label[contains(text(), 'Parcel')]/following-sibling::span",
+            CSS("span.parcel-id"),
+            CSS("td:contains('Parcel ID') + td"),
+            CSS("div.parcel-number"),
+            XP("//label[contains(text(), 'Parcel')]/following-sibling::span"),
         ],
 
         # Property Address
         "property_address": [
-            "div.property-address",
-            "span.address",
-            "td:contains('Property Address') + td",
-            "//label[contains(text(), 'Property Address')]/following-sibling::span",
+            CSS("div.property-address"),
+            CSS("span.address"),
+            CSS("td:contains('Property Address') + td"),
+            XP("//label[contains(text(), 'Property Address')]/following-sibling::span"),
         ],
 
         # Mailing Address
         "mailing_address": [
-            "div.mailing-address",
-            "span.mailing",
-            "td:contains('Mailing Address') + td",
-            "//label[contains(text(), 'Mailing Address')]/following-sibling::span",
+            CSS("div.mailing-address"),
+            CSS("span.mailing"),
+            CSS("td:contains('Mailing Address') + td"),
+            XP("//label[contains(text(), 'Mailing Address')]/following-sibling::span"),
         ],
 
         # City
         "city": [
-            "span.city",
-            "td:contains('City') + td",
-            "//label[contains(text(), 'City')]/following-sibling::span",
+            CSS("span.city"),
+            CSS("td:contains('City') + td"),
+            XP("//label[contains(text(), 'City')]/following-sibling::span"),
         ],
 
         # State
         "state": [
-            "span.state",
-            "td:contains('State') + td",
-            "//label[contains(text(), 'State')]/following-sibling::span",
+            CSS("span.state"),
+            CSS("td:contains('State') + td"),
+            XP("//label[contains(text(), 'State')]/following-sibling::span"),
         ],
 
         # ZIP Code
         "zip_code": [
-            "span.zip",
-            "span.zipcode",
-            "td:contains('ZIP') + td",
-            "td:contains('Zip Code') + td",
-            "//label[contains(text(), 'ZIP')]/following-sibling::span",
+            CSS("span.zip"),
+            CSS("span.zipcode"),
+            CSS("td:contains('ZIP') + td"),
+            CSS("td:contains('Zip Code') + td"),
+            XP("//label[contains(text(), 'ZIP')]/following-sibling::span"),
         ],
 
         # County
         "county": [
-            "span.county",
-            "td:contains('County') + td",
-            "//label[contains(text(), 'County')]/following-sibling::span",
+            CSS("span.county"),
+            CSS("td:contains('County') + td"),
+            XP("//label[contains(text(), 'County')]/following-sibling::span"),
         ],
 
         # Assessed Value
         "assessed_value": [
-            "span.assessed-value",
-            "td:contains('Assessed Value') + td",
-            "td:contains('Total Value') + td",
-            "//label[contains(text(), 'Assessed Value')]/following-sibling::span",
+            CSS("span.assessed-value"),
+            CSS("td:contains('Assessed Value') + td"),
+            CSS("td:contains('Total Value') + td"),
+            XP("//label[contains(text(), 'Assessed Value')]/following-sibling::span"),
         ],
 
         # Sale Date
         "sale_date": [
-            "span.sale-date",
-            "td:contains('Sale Date') + td",
-            "td:contains('Last Sale Date') + td",
-            "//label[contains(text(), 'Sale Date')]/following-sibling::span",
+            CSS("span.sale-date"),
+            CSS("td:contains('Sale Date') + td"),
+            CSS("td:contains('Last Sale Date') + td"),
+            XP("//label[contains(text(), 'Sale Date')]/following-sibling::span"),
         ],
 
         # Sale Price
         "sale_price": [
-            "span.sale-price",
-            "td:contains('Sale Price') + td",
-            "td:contains('Last Sale Price') + td",
-            "//label[contains(text(), 'Sale Price')]/following-sibling::span",
+            CSS("span.sale-price"),
+            CSS("td:contains('Sale Price') + td"),
+            CSS("td:contains('Last Sale Price') + td"),
+            XP("//label[contains(text(), 'Sale Price')]/following-sibling::span"),
         ],
     },
 
     # Pagination
     "pagination": {
         "next_page": [
-            "a.next-page",
-            "a:contains('Next')",
-            "button.pagination-next",
-            "//a[contains(text(), 'Next')]",
+            CSS("a.next-page"),
+            CSS("a:contains('Next')"),
+            CSS("button.pagination-next"),
+            XP("//a[contains(text(), 'Next')]"),
         ],
         "prev_page": [
-            "a.prev-page",
-            "a:contains('Previous')",
-            "button.pagination-prev",
+            CSS("a.prev-page"),
+            CSS("a:contains('Previous')"),
+            CSS("button.pagination-prev"),
         ],
-        "page_numbers": "ul.pagination li a",
-        "current_page": "ul.pagination li.active",
+        "page_numbers": CSS("ul.pagination li a"),
+        "current_page": CSS("ul.pagination li.active"),
     },
 
     # Loading Indicators
     "loading": {
         "spinner": [
-            "div.spinner",
-            "div.loading",
-            "img[alt='Loading']",
+            CSS("div.spinner"),
+            CSS("div.loading"),
+            CSS("img[alt='Loading']"),
         ],
-        "overlay": "div.loading-overlay",
+        "overlay": CSS("div.loading-overlay"),
     },
 
     # Error Messages
     "errors": {
         "error_message": [
-            "div.error",
-            "div.alert-danger",
-            "p.error-text",
-            "span.error-message",
+            CSS("div.error"),
+            CSS("div.alert-danger"),
+            CSS("p.error-text"),
+            CSS("span.error-message"),
         ],
-        "validation_error": "span.validation-error",
+        "validation_error": CSS("span.validation-error"),
     },
 }
 
@@ -164,20 +184,20 @@ ORANGE_COUNTY_SELECTORS = {
 # If primary selectors fail, try these alternative patterns
 FALLBACK_SELECTORS = {
     "owner_name": [
-        "//tr[td[contains(text(), 'Owner')]]/td[2]",
-        "//div[contains(@class, 'owner')]//text()",
+        XP("//tr[td[contains(text(), 'Owner')]]/td[2]"),
+        XP("//div[contains(@class, 'owner')]//text()"),
     ],
     "parcel_id": [
-        "//tr[td[contains(text(), 'Parcel')]]/td[2]",
-        "//div[contains(@class, 'parcel')]//text()",
+        XP("//tr[td[contains(text(), 'Parcel')]]/td[2]"),
+        XP("//div[contains(@class, 'parcel')]//text()"),
     ],
     "property_address": [
-        "//tr[td[contains(text(), 'Property Address')]]/td[2]",
-        "//tr[td[contains(text(), 'Site Address')]]/td[2]",
+        XP("//tr[td[contains(text(), 'Property Address')]]/td[2]"),
+        XP("//tr[td[contains(text(), 'Site Address')]]/td[2]"),
     ],
     "assessed_value": [
-        "//tr[td[contains(text(), 'Total')]]/td[2]",
-        "//tr[td[contains(text(), 'Value')]]/td[2]",
+        XP("//tr[td[contains(text(), 'Total')]]/td[2]"),
+        XP("//tr[td[contains(text(), 'Value')]]/td[2]"),
     ],
 }
 
@@ -198,9 +218,11 @@ def get_selector(field_name: str, selector_type: str = "property_details") -> li
     """
     selectors = ORANGE_COUNTY_SELECTORS.get(selector_type, {}).get(field_name, [])
 
-    # Ensure selectors is always a list
-    if isinstance(selectors, str):
+    # Ensure selectors is always a (new) list
+    if isinstance(selectors, Selector):
         selectors = [selectors]
+    else:
+        selectors = list(selectors)
 
     # Add fallback selectors if available
     if field_name in FALLBACK_SELECTORS:
@@ -220,3 +242,37 @@ def is_xpath(selector: str) -> bool:
         True if XPath, False if CSS
     """
     return selector.startswith("//") or selector.startswith("(")
+
+
+def to_selector(selector: Union[str, Selector]) -> Selector:
+    """
+    Classify a raw selector string (typed selectors pass through).
+
+    Args:
+        selector: Raw CSS/XPath string or Selector
+
+    Returns:
+        Typed Selector
+    """
+    if isinstance(selector, Selector):
+        return selector
+
+    return XP(selector) if is_xpath(selector) else CSS(selector)
+
+
+def selector_value(selector: Union[str, Selector]) -> str:
+    """
+    Resolve a selector to its Playwright-ready string.
+
+    Typed selectors already carry it; raw strings are classified first.
+
+    Args:
+        selector: Raw CSS/XPath string or Selector
+
+    Returns:
+        Selector string for Playwright (XPath prefixed with "xpath=")
+    """
+    if isinstance(selector, Selector):
+        return selector.value
+
+    return to_selector(selector).value
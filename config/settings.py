@@ -57,6 +57,10 @@ ORANGE_COUNTY_SCRAPER = {
     "headless": True,
     "browser": "chromium",  # chromium, firefox, or webkit
     "search_type": "owner_name",  # Default search type
+    "seen_db": RAW_DATA_DIR / "seen_urls.db",  # Visited detail URLs across runs
+    "skip_seen_urls": False,  # Skip URLs already extracted successfully within the TTL
+    "seen_ttl_hours": 24,
+    "seen_commit_interval": 100,  # Commit visited URLs every N records
 }
 
 # =======================
@@ -140,6 +144,10 @@ VALIDATION_PATTERNS = {
     "state": r"^[A-Z]{2}$",  # Two-letter state code
 }
 
+# Regex engine for pattern validation: "re" (stdlib) or "re2" (google-re2, linear-time
+# matching for complex patterns; falls back to "re" when not installed)
+VALIDATION_REGEX_ENGINE = "re"
+
 # =======================
 # Normalization Rules (FR-3)
 # =======================
@@ -265,6 +273,7 @@ PIPELINE_CONFIG = {
     "enable_progress_bar": True,
     "parallel_processing": False,  # Sequential for politeness
     "max_workers": 1,
+    "vectorized_merge": True,  # Merge sources with a pandas join instead of record by record
 }
 
 # =======================
@@ -276,6 +285,7 @@ COMPLIANCE_CONFIG = {
     "user_agent": "PropertyDataExtractor/1.0 (Educational/Portfolio Project)",
     "max_retries": 3,
     "backoff_factor": 2,
+    "max_backoff": 30,  # seconds, cap for exponential backoff
     "request_timeout": 30,
 }
 
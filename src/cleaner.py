@@ -6,7 +6,7 @@ the requirements (FR-3).
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
 
 from config.settings import NAME_NORMALIZATION, ADDRESS_NORMALIZATION
 from src.utils import get_logger
@@ -322,26 +322,51 @@ class PropertyCleaner:
         else:
             return zip_code[:5]
 
-    def clean_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def clean_batch(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Clean a batch of property records.
 
         Args:
-            records: List of property records
+            records: Iterable of property records
 
         Returns:
             List of cleaned records
         """
-        cleaned_records = []
-
-        for record in records:
-            try:
-                cleaned = self.clean_record(record)
-                cleaned_records.append(cleaned)
-            except Exception as e:
-                self.logger.error(f"Failed to clean record: {e}")
-                # Keep original record if cleaning fails
-                cleaned_records.append(record)
+        cleaned_records = list(self.iter_clean(records))
 
         self.logger.info(f"Cleaned {len(cleaned_records)} records")
         return cleaned_records
+
+    def iter_clean(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Clean records lazily, one at a time.
+
+        Args:
+            records: Iterable of property records
+
+        Yields:
+            Cleaned records
+        """
+        for record in records:
+            yield self.clean_record_for_merge(record)
+
+    def clean_record_for_merge(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Clean a record and attach its normalized merge key.
+
+        Args:
+            record: Property record
+
+        Returns:
+            Cleaned record (the original record if cleaning fails)
+        """
+        try:
+            cleaned = self.clean_record(record)
+            # Normalized merge key, computed once for the merge stage
+            parcel_id = cleaned.get("parcel_id")
+            cleaned["_parcel_key"] = str(parcel_id).strip().upper() if parcel_id else None
+            return cleaned
+        except Exception as e:
+            self.logger.error(f"Failed to clean record: {e}")
+            # Keep original record if cleaning fails
+            return record
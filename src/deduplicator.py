@@ -41,7 +41,8 @@ class PropertyDeduplicator:
         self,
         records: List[Dict[str, Any]],
         use_exact: bool = True,
-        use_fuzzy: bool = True
+        use_fuzzy: bool = True,
+        cross_source_only: bool = False
     ) -> Tuple[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
         """
         Find duplicate records in a list.
@@ -50,6 +51,8 @@ class PropertyDeduplicator:
             records: List of property records
             use_exact: Whether to use exact matching
             use_fuzzy: Whether to use fuzzy matching
+            cross_source_only: Whether fuzzy matching skips pairs of records
+                from the same single source (already compared per source)
 
         Returns:
             Tuple of (unique_records, duplicate_groups)
@@ -75,7 +78,7 @@ class PropertyDeduplicator:
                 if idx not in seen_indices
             ]
 
-            fuzzy_groups, fuzzy_seen = self._find_fuzzy_duplicates(remaining_records)
+            fuzzy_groups, fuzzy_seen = self._find_fuzzy_duplicates(remaining_records, cross_source_only)
             duplicate_groups.extend(fuzzy_groups)
             seen_indices.update(fuzzy_seen)
 
@@ -158,13 +161,16 @@ class PropertyDeduplicator:
 
     def _find_fuzzy_duplicates(
         self,
-        records: List[Tuple[int, Dict[str, Any]]]
+        records: List[Tuple[int, Dict[str, Any]]],
+        cross_source_only: bool = False
     ) -> Tuple[List[List[Dict[str, Any]]], Set[int]]:
         """
         Find fuzzy duplicates using similarity matching.
 
         Args:
             records: List of (index, record) tuples
+            cross_source_only: Whether to skip pairs of records from the same
+                single source (cross-source merged records are compared with all)
 
         Returns:
             Tuple of (duplicate_groups, seen_indices)
@@ -172,6 +178,12 @@ class PropertyDeduplicator:
         duplicate_groups = []
         seen_indices = set()
 
+        # Source of each single-source record; None for cross-source merged records
+        sources = [
+            None if rec.get("is_cross_source_merged") else rec.get("source")
+            for _, rec in records
+        ]
+
         # Compare each pair of records
         for i in range(len(records)):
             if records[i][0] in seen_indices:
@@ -186,6 +198,10 @@ class PropertyDeduplicator:
                 if records[j][0] in seen_indices:
                     continue
 
+                # Same-source pairs were already compared by deduplicate_within_source
+                if cross_source_only and sources[i] is not None and sources[i] == sources[j]:
+                    continue
+
                 idx_j, rec_j = records[j]
 
                 # Check if records are fuzzy duplicates
@@ -336,10 +352,8 @@ class PropertyDeduplicator:
         """
         merged = {}
 
-        # Get all unique fields
-        all_fields = set()
-        for record in duplicate_group:
-            all_fields.update(record.keys())
+        # Get all unique fields (union of the records' key views in one call)
+        all_fields = set().union(*duplicate_group)
 
         # For each field, select the most complete value
         for field in all_fields:
@@ -370,8 +384,10 @@ class PropertyDeduplicator:
         records: List[Dict[str, Any]],
         merge_strategy: str = "most_complete",
         use_exact: bool = True,
-        use_fuzzy: bool = True
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        use_fuzzy: bool = True,
+        return_groups: bool = False,
+        cross_source_only: bool = False
+    ) -> Tuple:
         """
         Find duplicates and merge them.
 
@@ -380,16 +396,20 @@ class PropertyDeduplicator:
             merge_strategy: Strategy for merging duplicates
             use_exact: Whether to use exact matching
             use_fuzzy: Whether to use fuzzy matching
+            return_groups: Whether to also return the duplicate groups
+            cross_source_only: Whether fuzzy matching skips same-source pairs
 
         Returns:
             Tuple of (deduplicated_records, original_duplicates)
-            where original_duplicates contains all records from duplicate groups
+            where original_duplicates contains all records from duplicate groups,
+            plus duplicate_groups as a third element if return_groups is True
         """
         # Find duplicates
         unique_records, duplicate_groups = self.find_duplicates(
             records,
             use_exact=use_exact,
-            use_fuzzy=use_fuzzy
+            use_fuzzy=use_fuzzy,
+            cross_source_only=cross_source_only
         )
 
         # Merge each duplicate group
@@ -409,8 +429,67 @@ class PropertyDeduplicator:
             f"({len(unique_records)} unique + {len(merged_records)} merged)"
         )
 
+        if return_groups:
+            return deduplicated_records, all_duplicates, duplicate_groups
+
         return deduplicated_records, all_duplicates
 
+    def deduplicate_within_source(
+        self,
+        records: List[Dict[str, Any]],
+        merge_strategy: str = "most_complete",
+        return_groups: bool = False
+    ) -> Tuple:
+        """
+        Deduplicate records from a single source.
+
+        Run before merging so fewer records enter the cross-source join.
+
+        Args:
+            records: Records from one source
+            merge_strategy: Strategy for merging duplicates
+            return_groups: Whether to also return the duplicate groups
+
+        Returns:
+            Tuple of (deduplicated_records, original_duplicates), plus
+            duplicate_groups if return_groups is True
+        """
+        return self.deduplicate_and_merge(
+            records,
+            merge_strategy=merge_strategy,
+            return_groups=return_groups
+        )
+
+    def deduplicate_across_sources(
+        self,
+        records: List[Dict[str, Any]],
+        merge_strategy: str = "most_complete",
+        return_groups: bool = False
+    ) -> Tuple:
+        """
+        Deduplicate merged records from multiple sources.
+
+        Exact parcel_id matches are already combined by the merger and each
+        source has been deduplicated, so only fuzzy matching runs here, and
+        only between records from different sources (or cross-source merged ones).
+
+        Args:
+            records: Merged records
+            merge_strategy: Strategy for merging duplicates
+            return_groups: Whether to also return the duplicate groups
+
+        Returns:
+            Tuple of (deduplicated_records, original_duplicates), plus
+            duplicate_groups if return_groups is True
+        """
+        return self.deduplicate_and_merge(
+            records,
+            merge_strategy=merge_strategy,
+            use_exact=False,
+            return_groups=return_groups,
+            cross_source_only=True
+        )
+
     def get_duplicate_statistics(
         self,
         duplicate_groups: List[List[Dict[str, Any]]]
@@ -5,7 +5,7 @@ This module adds quality scores and metadata to property records
 as specified in FR-6.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 from datetime import datetime
 
 from config.settings import QUALITY_SCORE_WEIGHTS, QUALITY_THRESHOLDS
@@ -156,30 +156,39 @@ class PropertyEnricher:
 
         return round(completeness, 2)
 
-    def enrich_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def enrich_batch(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Enrich a batch of property records.
 
         Args:
-            records: List of property records
+            records: Iterable of property records
 
         Returns:
             List of enriched records
         """
-        enriched_records = []
+        enriched_records = list(self.iter_enrich(records))
+
+        self.logger.info(f"Enriched {len(enriched_records)} records")
+
+        return enriched_records
+
+    def iter_enrich(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Enrich records lazily, one at a time.
 
+        Args:
+            records: Iterable of property records
+
+        Yields:
+            Enriched records
+        """
         for record in records:
             try:
-                enriched = self.enrich_record(record)
-                enriched_records.append(enriched)
+                yield self.enrich_record(record)
             except Exception as e:
                 self.logger.error(f"Failed to enrich record: {e}")
                 # Keep original record if enrichment fails
-                enriched_records.append(record)
-
-        self.logger.info(f"Enriched {len(enriched_records)} records")
-
-        return enriched_records
+                yield record
 
     def get_field_coverage(
         self,
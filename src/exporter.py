@@ -170,8 +170,8 @@ class PropertyExporter:
             "extracted_at",
         ]
 
-        # Get all fields
-        all_fields = list(record.keys())
+        # Get all fields (underscore-prefixed fields are internal)
+        all_fields = [field for field in record if not field.startswith("_")]
 
         # Order: priority fields first, then remaining fields alphabetically
         ordered_fields = []
@@ -372,7 +372,7 @@ class PropertyExporter:
 
         # Write CSV
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
+            writer = csv.DictWriter(f, fieldnames=headers, extrasaction="ignore")
             writer.writeheader()
             writer.writerows(records)
 
@@ -407,7 +407,12 @@ class PropertyExporter:
 
         # Write JSON
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2, default=str)
+            json.dump(
+                [{k: v for k, v in record.items() if not k.startswith("_")} for record in records],
+                f,
+                indent=2,
+                default=str,
+            )
 
         self.logger.info(f"JSON file created: {output_path}")
         return output_path
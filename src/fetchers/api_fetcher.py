@@ -5,6 +5,7 @@ This module handles fetching property records from the Wake County Open Data API
 with rate limiting, retries, and error handling.
 """
 
+import sys
 import time
 import requests
 from typing import Dict, List, Optional, Any
@@ -19,6 +20,11 @@ from config.settings import (
 from src.utils import get_logger, save_checkpoint, Timer
 
 
+def _intern(value: Any) -> Any:
+    """Intern a string value so repeated values share one object; other values pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class WakeCountyAPIFetcher:
     """Fetcher for Wake County Open Data API."""
 
@@ -257,9 +263,11 @@ class WakeCountyAPIFetcher:
                 "parcel_id": record.get("PIN_NUM", record.get("REID", "")),
                 "property_address": record.get("SITE_ADDRESS", ""),
                 "mailing_address": "",  # Not available in this dataset
-                "city": record.get("CITY", ""),
+                # Cities and ZIP codes repeat across records; interned copies share
+                # one object (and its cached hash) through validation and dedup
+                "city": _intern(record.get("CITY", "")),
                 "state": "NC",
-                "zip_code": str(record.get("ZIPNUM", "")) if record.get("ZIPNUM") else "",
+                "zip_code": _intern(str(record["ZIPNUM"])) if record.get("ZIPNUM") else "",
                 "county": "Wake",
                 "assessed_value": record.get("TOTAL_VALUE_ASSD", None),
                 "sale_date": record.get("SALE_DATE", ""),
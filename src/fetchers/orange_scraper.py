@@ -5,16 +5,115 @@ This module implements scraping for the Orange County Tax Assessor website,
 extending the base web scraper class.
 """
 
+import json
 import time
+import sqlite3
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import urljoin
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
 
 from config.settings import ORANGE_COUNTY_SCRAPER, RAW_DATA_DIR
-from config.selectors import ORANGE_COUNTY_SELECTORS, get_selector
+from config.selectors import ORANGE_COUNTY_SELECTORS, Selector, get_selector, to_selector
 from src.fetchers.web_scraper import WebScraperBase
 from src.utils import get_logger, Timer
 
 
+# Returns the absolute URL of the first link in each row (rows without a link are dropped)
+ROW_LINKS_JS = """
+(rows, base) => rows
+    .map(row => {
+        const a = row.querySelector('a[href]');
+        return a ? new URL(a.getAttribute('href'), base).toString() : null;
+    })
+    .filter(Boolean)
+"""
+
+# Returns the absolute URLs of the pagination links
+PAGE_LINKS_JS = "links => links.map(a => a.href).filter(Boolean)"
+
+# Detail fields read from the property page (county is fixed for this source)
+DETAIL_FIELDS = (
+    "owner_name",
+    "parcel_id",
+    "property_address",
+    "mailing_address",
+    "city",
+    "state",
+    "zip_code",
+    "assessed_value",
+    "sale_date",
+    "sale_price",
+)
+
+
+def build_detail_extractor(spec: Dict[str, Any], fields: tuple = DETAIL_FIELDS) -> str:
+    """
+    Generate a JS init script defining window.__extractPropertyDetails().
+
+    The selector spec is baked into the script, so each detail page needs a
+    single page.evaluate() call instead of one query per selector.
+
+    Args:
+        spec: Mapping of field name to Selector or list of fallback Selectors
+        fields: Fields to extract
+
+    Returns:
+        JavaScript source for page.add_init_script()
+    """
+    lines = []
+    for field in fields:
+        selectors = spec.get(field, [])
+        if not isinstance(selectors, list):
+            selectors = [selectors]
+
+        compiled = []
+        for selector in map(to_selector, selectors):
+            if selector.kind == "xpath":
+                compiled.append([True, selector.value[len("xpath="):]])
+            else:
+                compiled.append([False, selector.value])
+
+        lines.append(f"        out[{json.dumps(field)}] = text({json.dumps(compiled)});")
+
+    body = "\n".join(lines)
+
+    return f"""
+(() => {{
+    const node = (isXPath, selector) => {{
+        try {{
+            if (isXPath) {{
+                return document.evaluate(
+                    selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue;
+            }}
+            return document.querySelector(selector);
+        }} catch (e) {{
+            return null;  // Selector not supported natively
+        }}
+    }};
+    const text = (selectors) => {{
+        for (const [isXPath, selector] of selectors) {{
+            const el = node(isXPath, selector);
+            const value = el ? (el.innerText ?? el.textContent ?? "").trim() : "";
+            if (value) return value;
+        }}
+        return "";
+    }};
+    window.__extractPropertyDetails = () => {{
+        const out = {{}};
+{body}
+        return out;
+    }};
+}})();
+"""
+
+
 class OrangeCountyScraper(WebScraperBase):
     """Scraper for Orange County Tax Assessor website."""
 
@@ -29,8 +128,112 @@ class OrangeCountyScraper(WebScraperBase):
         self.base_url = ORANGE_COUNTY_SCRAPER["base_url"]
         self.max_records = ORANGE_COUNTY_SCRAPER["max_records"]
 
+        # Visited-URL store (persists across runs)
+        self.seen_db_path = ORANGE_COUNTY_SCRAPER["seen_db"]
+        self.skip_seen_urls = ORANGE_COUNTY_SCRAPER["skip_seen_urls"]
+        self.seen_ttl = timedelta(hours=ORANGE_COUNTY_SCRAPER["seen_ttl_hours"])
+        self.seen_commit_interval = ORANGE_COUNTY_SCRAPER["seen_commit_interval"]
+        self._seen: Optional[sqlite3.Connection] = None
+        self._seen_pending = 0
+
+        # Shared extraction timestamp for the current scrape batch
+        self._batch_ts: Optional[str] = None
+
+        # Detail-page extractor compiled once for the fixed selector spec
+        self._detail_extractor_js = build_detail_extractor(ORANGE_COUNTY_SELECTORS["property_details"])
+
+        # Fallback detail selectors, resolved to strings once
+        self._detail_selector_values = {
+            field: self._selector_values(ORANGE_COUNTY_SELECTORS["property_details"][field])
+            for field in DETAIL_FIELDS
+        }
+
         self.logger = get_logger(__name__)
 
+    def start(self):
+        """Start the browser instance and open the visited-URL store."""
+        super().start()
+
+        # Installed on every page load so detail extraction is one evaluate() call
+        self.context.add_init_script(self._detail_extractor_js)
+
+        self._open_seen_store()
+
+    def close(self):
+        """Close the visited-URL store, then the browser."""
+        self._close_seen_store()
+        super().close()
+
+    def _open_seen_store(self):
+        """Open (or create) the SQLite database of visited property URLs."""
+        try:
+            self._seen = sqlite3.connect(str(self.seen_db_path))
+            self._seen.execute(
+                "CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, extracted_at TEXT, ok INT)"
+            )
+            self._seen.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Visited-URL store unavailable ({self.seen_db_path}): {e}")
+            self._seen = None
+
+    def _close_seen_store(self):
+        """Flush pending writes and close the visited-URL store."""
+        if self._seen is None:
+            return
+
+        try:
+            self._seen.commit()
+            self._seen.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to close visited-URL store: {e}")
+        finally:
+            self._seen = None
+            self._seen_pending = 0
+
+    def _is_seen(self, url: str) -> bool:
+        """
+        Check if a URL was already extracted successfully within the TTL.
+
+        Args:
+            url: Property detail URL
+
+        Returns:
+            True if the URL can be skipped, False otherwise
+        """
+        if self._seen is None or not self.skip_seen_urls:
+            return False
+
+        row = self._seen.execute(
+            "SELECT extracted_at, ok FROM seen WHERE url = ?", (url,)
+        ).fetchone()
+
+        if not row or not row[1]:
+            return False
+
+        return datetime.now() - datetime.fromisoformat(row[0]) < self.seen_ttl
+
+    def _mark_seen(self, url: str, ok: bool):
+        """
+        Record the extraction outcome for a URL.
+
+        Args:
+            url: Property detail URL
+            ok: Whether the extraction succeeded
+        """
+        if self._seen is None:
+            return
+
+        self._seen.execute(
+            "INSERT OR REPLACE INTO seen (url, extracted_at, ok) VALUES (?, ?, ?)",
+            (url, datetime.now().isoformat(), int(ok))
+        )
+
+        # Batch commits
+        self._seen_pending += 1
+        if self._seen_pending >= self.seen_commit_interval:
+            self._seen.commit()
+            self._seen_pending = 0
+
     def scrape_properties(
         self,
         max_records: Optional[int] = None,
@@ -53,6 +256,10 @@ class OrangeCountyScraper(WebScraperBase):
 
             self.logger.info(f"Starting Orange County scrape (max {max_records} records)")
 
+            # One timestamp per batch keeps records from the same run comparable
+            # (naive local ISO, the same format as the Wake County fetcher)
+            self._batch_ts = datetime.now().isoformat()
+
             # Navigate to base URL
             if not self.navigate(self.base_url):
                 self.logger.error("Failed to navigate to Orange County website")
@@ -130,15 +337,23 @@ class OrangeCountyScraper(WebScraperBase):
 
         self.logger.info(f"Found {len(property_links)} property links")
 
+        skipped = 0
+
         # Visit each property page
         for idx, link in enumerate(property_links, 1):
             try:
+                # Skip pages already extracted in a previous run
+                if self._is_seen(link):
+                    skipped += 1
+                    continue
+
                 self.logger.debug(f"Processing property {idx}/{len(property_links)}: {link}")
 
                 # Navigate to property detail page
                 if not self.navigate(link):
                     self.logger.warning(f"Failed to navigate to {link}")
                     self.stats["failed_extractions"] += 1
+                    self._mark_seen(link, False)
                     continue
 
                 # Extract property data
@@ -151,6 +366,8 @@ class OrangeCountyScraper(WebScraperBase):
                 else:
                     self.stats["failed_extractions"] += 1
 
+                self._mark_seen(link, bool(record))
+
                 # Check if we've reached max records
                 if len(records) >= max_records:
                     self.logger.info(f"Reached maximum records limit: {max_records}")
@@ -161,6 +378,13 @@ class OrangeCountyScraper(WebScraperBase):
                 self.stats["failed_extractions"] += 1
                 continue
 
+        if skipped:
+            self.logger.info(f"Skipped {skipped} property pages already extracted")
+
+        if self._seen is not None:
+            self._seen.commit()
+            self._seen_pending = 0
+
         return records
 
     def _get_property_links(self, max_links: int) -> List[str]:
@@ -186,25 +410,20 @@ class OrangeCountyScraper(WebScraperBase):
                     # Extract links from table rows
                     row_selector = table_selectors.get("rows") or table_selectors.get("rows_alt")
                     if row_selector:
-                        # Get all row elements
-                        rows = self.page.query_selector_all(row_selector)
-
-                        for row in rows[:max_links]:
-                            # Try to find link in row
-                            link_element = row.query_selector("a[href]")
-                            if link_element:
-                                href = link_element.get_attribute("href")
-                                if href:
-                                    # Make absolute URL if relative
-                                    if href.startswith("http"):
-                                        full_url = href
-                                    else:
-                                        base = self.base_url.rsplit("/", 1)[0]
-                                        full_url = f"{base}/{href.lstrip('/')}"
-
-                                    links.append(full_url)
+                        # Resolve every row's link in a single browser round-trip
+                        hrefs = self.page.eval_on_selector_all(
+                            row_selector.value,
+                            ROW_LINKS_JS,
+                            self.base_url,
+                        )
+                        links.extend(hrefs[:max_links])
 
                         if links:
+                            # Remaining result pages, if the listing is paginated
+                            if len(links) < max_links:
+                                links.extend(
+                                    self._get_paginated_links(row_selector, max_links - len(links))
+                                )
                             break
 
         except Exception as e:
@@ -212,6 +431,70 @@ class OrangeCountyScraper(WebScraperBase):
 
         return links
 
+    def _get_paginated_links(self, row_selector: Selector, max_links: int) -> List[str]:
+        """
+        Extract property links from the remaining result pages.
+
+        Each page is fetched as raw HTML and parsed without rendering. Pages
+        whose table is JS-rendered (nothing parsed) fall back to the browser.
+
+        Args:
+            row_selector: Selector for result table rows
+            max_links: Maximum number of links to extract
+
+        Returns:
+            List of property detail URLs
+        """
+        links = []
+
+        page_urls = self.page.eval_on_selector_all(
+            ORANGE_COUNTY_SELECTORS["pagination"]["page_numbers"].value,
+            PAGE_LINKS_JS,
+        )
+        current_url = self.page.url
+
+        for page_url in dict.fromkeys(page_urls):
+            if page_url == current_url:
+                continue
+
+            page_links = self._parse_row_links(self.fetch_html(page_url), row_selector, page_url)
+
+            if not page_links and self.navigate(page_url):
+                self.logger.debug(f"No rows parsed from HTML, using browser for {page_url}")
+                page_links = self.page.eval_on_selector_all(row_selector.value, ROW_LINKS_JS, page_url)
+
+            links.extend(page_links)
+
+            if len(links) >= max_links:
+                break
+
+        return links[:max_links]
+
+    def _parse_row_links(self, html: str, row_selector: Selector, page_url: str) -> List[str]:
+        """
+        Parse property links from result table rows in raw HTML.
+
+        Args:
+            html: Results page HTML
+            row_selector: Selector for result table rows
+            page_url: URL of the page (for resolving relative links)
+
+        Returns:
+            List of property detail URLs
+        """
+        if not html or not BS4_AVAILABLE or row_selector.kind != "css":
+            return []
+
+        links = []
+        soup = BeautifulSoup(html, "lxml")
+
+        for row in soup.select(row_selector.value):
+            link_element = row.select_one("a[href]")
+            if link_element:
+                links.append(urljoin(page_url, link_element["href"]))
+
+        return links
+
     def _extract_single_property(self) -> Optional[Dict[str, Any]]:
         """
         Extract data from a single property detail page.
@@ -220,25 +503,24 @@ class OrangeCountyScraper(WebScraperBase):
             Property record dictionary or None if extraction fails
         """
         try:
-            # Get selectors for property details
-            detail_selectors = ORANGE_COUNTY_SELECTORS["property_details"]
+            fields = self._extract_detail_fields()
 
             # Extract all fields
             record = {
-                "owner_name": self.extract_text(detail_selectors["owner_name"]),
-                "parcel_id": self.extract_text(detail_selectors["parcel_id"]),
-                "property_address": self.extract_text(detail_selectors["property_address"]),
-                "mailing_address": self.extract_text(detail_selectors["mailing_address"]),
-                "city": self.extract_text(detail_selectors["city"]),
-                "state": self.extract_text(detail_selectors["state"]),
-                "zip_code": self.extract_text(detail_selectors["zip_code"]),
+                "owner_name": fields.get("owner_name", ""),
+                "parcel_id": fields.get("parcel_id", ""),
+                "property_address": fields.get("property_address", ""),
+                "mailing_address": fields.get("mailing_address", ""),
+                "city": fields.get("city", ""),
+                "state": fields.get("state", ""),
+                "zip_code": fields.get("zip_code", ""),
                 "county": "Orange",
-                "assessed_value": self.extract_text(detail_selectors["assessed_value"]),
-                "sale_date": self.extract_text(detail_selectors["sale_date"]),
-                "sale_price": self.extract_text(detail_selectors["sale_price"]),
+                "assessed_value": fields.get("assessed_value", ""),
+                "sale_date": fields.get("sale_date", ""),
+                "sale_price": fields.get("sale_price", ""),
                 "source": "Orange County Scraper",
                 "source_url": self.page.url,
-                "extracted_at": datetime.now().isoformat(),
+                "extracted_at": self._batch_ts or datetime.now().isoformat(),
             }
 
             # Check if we got meaningful data
@@ -252,6 +534,30 @@ class OrangeCountyScraper(WebScraperBase):
             self.logger.error(f"Failed to extract property data: {e}")
             return None
 
+    def _extract_detail_fields(self) -> Dict[str, str]:
+        """
+        Extract all detail fields from the current page.
+
+        Uses the injected extractor when available, otherwise falls back to
+        querying each selector individually.
+
+        Returns:
+            Dictionary mapping field names to extracted text
+        """
+        try:
+            fields = self.page.evaluate(
+                "window.__extractPropertyDetails ? window.__extractPropertyDetails() : null"
+            )
+            if fields is not None:
+                return fields
+        except Exception as e:
+            self.logger.debug(f"Detail extractor unavailable, querying selectors: {e}")
+
+        return {
+            field: self._extract_text_values(selectors)
+            for field, selectors in self._detail_selector_values.items()
+        }
+
     def scrape_and_normalize(
         self,
         max_records: Optional[int] = None,
@@ -7,6 +7,7 @@ and error handling.
 """
 
 import time
+import random
 import asyncio
 from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from datetime import datetime
@@ -30,10 +31,13 @@ from config.settings import (
     COMPLIANCE_CONFIG,
     RAW_DATA_DIR,
 )
-from config.selectors import is_xpath
+from config.selectors import Selector, selector_value
 from src.utils import get_logger, Timer
 
 
+SelectorLike = Union[str, Selector]
+
+
 class WebScraperBase:
     """Base class for web scraping with Playwright."""
 
@@ -67,6 +71,11 @@ class WebScraperBase:
         # Compliance
         self.user_agent = COMPLIANCE_CONFIG["user_agent"]
 
+        # Retry policy for transient navigation failures
+        self.max_retries = COMPLIANCE_CONFIG["max_retries"]
+        self.backoff_factor = COMPLIANCE_CONFIG["backoff_factor"]
+        self.max_backoff = COMPLIANCE_CONFIG["max_backoff"]
+
         # Browser components
         self.playwright = None
         self.browser: Optional[Browser] = None
@@ -79,6 +88,7 @@ class WebScraperBase:
             "successful_extractions": 0,
             "failed_extractions": 0,
             "total_records": 0,
+            "retry_success": 0,
         }
 
     def __enter__(self):
@@ -122,10 +132,13 @@ class WebScraperBase:
             self.logger.error(f"Failed to start browser: {e}")
             raise
 
-    def navigate(self, url: str, wait_for: Optional[str] = None) -> bool:
+    def navigate(self, url: str, wait_for: Optional[SelectorLike] = None) -> bool:
         """
         Navigate to a URL.
 
+        Network errors, timeouts and 5xx responses are retried with capped
+        exponential backoff. 4xx responses are not retried.
+
         Args:
             url: URL to navigate to
             wait_for: Optional selector to wait for after navigation
@@ -134,16 +147,40 @@ class WebScraperBase:
             True if navigation successful, False otherwise
         """
         try:
-            self.logger.debug(f"Navigating to: {url}")
-
-            # Navigate to URL
-            response = self.page.goto(url, wait_until="domcontentloaded")
-
-            # Check response status
-            if response and response.status >= 400:
-                self.logger.warning(f"HTTP {response.status} for {url}")
+            for attempt in range(1, self.max_retries + 1):
+                self.logger.debug(f"Navigating to: {url} (attempt {attempt}/{self.max_retries})")
+
+                try:
+                    response = self.page.goto(url, wait_until="domcontentloaded")
+                except Error as e:
+                    # Timeouts and network errors are transient - retry
+                    self.logger.warning(
+                        f"Navigation error for {url} (attempt {attempt}/{self.max_retries}): {e}"
+                    )
+                else:
+                    # Server errors are transient - retry
+                    if response and response.status >= 500:
+                        self.logger.warning(
+                            f"HTTP {response.status} for {url} (attempt {attempt}/{self.max_retries})"
+                        )
+                    # Client errors will not succeed on retry
+                    elif response and response.status >= 400:
+                        self.logger.warning(f"HTTP {response.status} for {url}")
+                        return False
+                    else:
+                        break
+
+                if attempt < self.max_retries:
+                    wait_time = min(self.backoff_factor ** (attempt - 1), self.max_backoff) + random.random()
+                    self.logger.info(f"Retrying in {wait_time:.1f} seconds...")
+                    time.sleep(wait_time)
+            else:
+                self.logger.error(f"Navigation failed after {self.max_retries} attempts: {url}")
                 return False
 
+            if attempt > 1:
+                self.stats["retry_success"] += 1
+
             # Wait for specific selector if provided
             if wait_for:
                 self.wait_for_selector(wait_for)
@@ -161,9 +198,50 @@ class WebScraperBase:
             self.logger.error(f"Navigation failed: {e}")
             return False
 
+    def fetch_html(self, url: str) -> str:
+        """
+        Fetch raw HTML without rendering the page.
+
+        Uses the browser context's HTTP client, so cookies and session state
+        are shared with the browser but no JS/CSS/images are loaded.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content as string, or empty string on failure
+        """
+        try:
+            self.logger.debug(f"Fetching HTML: {url}")
+
+            response = self.context.request.get(
+                url,
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+            )
+
+            if not response.ok:
+                self.logger.warning(f"HTTP {response.status} for {url}")
+                return ""
+
+            html = response.text()
+
+            self.stats["pages_visited"] += 1
+
+            # Apply rate limiting
+            if self.delay > 0:
+                self.logger.debug(f"Rate limiting: waiting {self.delay} seconds")
+                time.sleep(self.delay)
+
+            return html
+
+        except Exception as e:
+            self.logger.error(f"HTML fetch failed for {url}: {e}")
+            return ""
+
     def wait_for_selector(
         self,
-        selector: str,
+        selector: SelectorLike,
         timeout: Optional[int] = None,
         state: str = "visible"
     ) -> bool:
@@ -171,7 +249,7 @@ class WebScraperBase:
         Wait for a selector to appear.
 
         Args:
-            selector: CSS selector or XPath
+            selector: Selector or raw CSS/XPath string
             timeout: Timeout in milliseconds (default: use instance timeout)
             state: State to wait for (visible, attached, hidden, detached)
 
@@ -181,18 +259,11 @@ class WebScraperBase:
         try:
             timeout_ms = timeout if timeout is not None else self.timeout
 
-            if is_xpath(selector):
-                self.page.wait_for_selector(
-                    f"xpath={selector}",
-                    timeout=timeout_ms,
-                    state=state
-                )
-            else:
-                self.page.wait_for_selector(
-                    selector,
-                    timeout=timeout_ms,
-                    state=state
-                )
+            self.page.wait_for_selector(
+                selector_value(selector),
+                timeout=timeout_ms,
+                state=state
+            )
 
             return True
 
@@ -200,9 +271,25 @@ class WebScraperBase:
             self.logger.debug(f"Selector not found: {selector} ({e})")
             return False
 
+    @staticmethod
+    def _selector_values(selectors: Union[SelectorLike, List[SelectorLike]]) -> List[str]:
+        """
+        Resolve one selector or a list of fallback selectors to strings.
+
+        Args:
+            selectors: Single selector or list of selectors
+
+        Returns:
+            List of Playwright-ready selector strings, in order
+        """
+        if isinstance(selectors, (str, Selector)):
+            selectors = [selectors]
+
+        return [selector_value(selector) for selector in selectors]
+
     def extract_text(
         self,
-        selectors: Union[str, List[str]],
+        selectors: Union[SelectorLike, List[SelectorLike]],
         default: str = ""
     ) -> str:
         """
@@ -215,17 +302,22 @@ class WebScraperBase:
         Returns:
             Extracted text or default value
         """
-        # Ensure selectors is a list
-        if isinstance(selectors, str):
-            selectors = [selectors]
+        return self._extract_text_values(self._selector_values(selectors), default)
+
+    def _extract_text_values(self, selectors: List[str], default: str = "") -> str:
+        """
+        Extract text using already-resolved selector strings.
+
+        Args:
+            selectors: Playwright-ready selector strings to try, in order
+            default: Default value if extraction fails
 
-        # Try each selector
+        Returns:
+            Extracted text or default value
+        """
         for selector in selectors:
             try:
-                if is_xpath(selector):
-                    element = self.page.query_selector(f"xpath={selector}")
-                else:
-                    element = self.page.query_selector(selector)
+                element = self.page.query_selector(selector)
 
                 if element:
                     text = element.inner_text().strip()
@@ -242,7 +334,7 @@ class WebScraperBase:
 
     def extract_attribute(
         self,
-        selectors: Union[str, List[str]],
+        selectors: Union[SelectorLike, List[SelectorLike]],
         attribute: str,
         default: str = ""
     ) -> str:
@@ -257,17 +349,12 @@ class WebScraperBase:
         Returns:
             Extracted attribute value or default value
         """
-        # Ensure selectors is a list
-        if isinstance(selectors, str):
-            selectors = [selectors]
+        # Resolve selectors to strings once, then try each
+        selectors = self._selector_values(selectors)
 
-        # Try each selector
         for selector in selectors:
             try:
-                if is_xpath(selector):
-                    element = self.page.query_selector(f"xpath={selector}")
-                else:
-                    element = self.page.query_selector(selector)
+                element = self.page.query_selector(selector)
 
                 if element:
                     attr_value = element.get_attribute(attribute)
@@ -282,12 +369,12 @@ class WebScraperBase:
         self.logger.debug(f"No attribute '{attribute}' found for selectors: {selectors}")
         return default
 
-    def click(self, selector: str, timeout: Optional[int] = None) -> bool:
+    def click(self, selector: SelectorLike, timeout: Optional[int] = None) -> bool:
         """
         Click an element.
 
         Args:
-            selector: CSS selector or XPath
+            selector: Selector or raw CSS/XPath string
             timeout: Timeout in milliseconds
 
         Returns:
@@ -296,10 +383,7 @@ class WebScraperBase:
         try:
             timeout_ms = timeout if timeout is not None else self.timeout
 
-            if is_xpath(selector):
-                self.page.click(f"xpath={selector}", timeout=timeout_ms)
-            else:
-                self.page.click(selector, timeout=timeout_ms)
+            self.page.click(selector_value(selector), timeout=timeout_ms)
 
             return True
 
@@ -307,12 +391,12 @@ class WebScraperBase:
             self.logger.error(f"Click failed for selector '{selector}': {e}")
             return False
 
-    def fill_input(self, selector: str, value: str, timeout: Optional[int] = None) -> bool:
+    def fill_input(self, selector: SelectorLike, value: str, timeout: Optional[int] = None) -> bool:
         """
         Fill an input field.
 
         Args:
-            selector: CSS selector or XPath
+            selector: Selector or raw CSS/XPath string
             value: Value to fill
             timeout: Timeout in milliseconds
 
@@ -322,10 +406,7 @@ class WebScraperBase:
         try:
             timeout_ms = timeout if timeout is not None else self.timeout
 
-            if is_xpath(selector):
-                self.page.fill(f"xpath={selector}", value, timeout=timeout_ms)
-            else:
-                self.page.fill(selector, value, timeout=timeout_ms)
+            self.page.fill(selector_value(selector), value, timeout=timeout_ms)
 
             return True
 
@@ -388,21 +469,18 @@ class WebScraperBase:
             self.logger.error(f"Failed to save HTML: {e}")
             return False
 
-    def check_element_exists(self, selector: str) -> bool:
+    def check_element_exists(self, selector: SelectorLike) -> bool:
         """
         Check if element exists on page.
 
         Args:
-            selector: CSS selector or XPath
+            selector: Selector or raw CSS/XPath string
 
         Returns:
             True if element exists, False otherwise
         """
         try:
-            if is_xpath(selector):
-                element = self.page.query_selector(f"xpath={selector}")
-            else:
-                element = self.page.query_selector(selector)
+            element = self.page.query_selector(selector_value(selector))
 
             return element is not None
 
@@ -426,6 +504,7 @@ class WebScraperBase:
             "successful_extractions": 0,
             "failed_extractions": 0,
             "total_records": 0,
+            "retry_success": 0,
         }
 
     def close(self):
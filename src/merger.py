@@ -5,18 +5,117 @@ This module merges records from Wake County API and Orange County scraper
 based on parcel_id matching as specified in FR-5.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from collections import Counter, defaultdict
+from itertools import chain, zip_longest
 
+import numpy as np
+import pandas as pd
+
+from config.settings import FIELD_TYPES
 from src.utils import get_logger
 
 
+# Fixed property schema, in export order
+PROPERTY_FIELDS: Tuple[str, ...] = tuple(FIELD_TYPES)
+
+# Fields with their own merge rules in merge_record_pair
+SPECIAL_FIELDS = frozenset({"source", "source_url", "extracted_at"})
+
+REGULAR_FIELDS: Tuple[str, ...] = tuple(
+    field for field in PROPERTY_FIELDS if field not in SPECIAL_FIELDS
+)
+
+# Per-field merge rules, inlined by build_pair_merger (see _merge_field_values).
+# String fields fast-path two non-blank strings; numeric fields fast-path two
+# non-string values. Anything else goes through the generic rule.
+_STR_FIELD_TEMPLATE = """
+    if {field} in r1 or {field} in r2:
+        v1 = r1.get({field})
+        v2 = r2.get({field})
+        if v1.__class__ is str and v2.__class__ is str and v1.strip() and v2.strip():
+            if prefer and (s1 == prefer or s2 == prefer):
+                out[{field}] = v1 if s1 == prefer else v2
+            else:
+                out[{field}] = v1 if _len(v1) >= _len(v2) else v2
+        else:
+            out[{field}] = merge_value(v1, v2, prefer, s1, s2)
+"""
+
+_SCALAR_FIELD_TEMPLATE = """
+    if {field} in r1 or {field} in r2:
+        v1 = r1.get({field})
+        v2 = r2.get({field})
+        if v1 is not None and v2 is not None and v1.__class__ is not str and v2.__class__ is not str:
+            out[{field}] = v1 if not prefer or s1 == prefer or s2 != prefer else v2
+        else:
+            out[{field}] = merge_value(v1, v2, prefer, s1, s2)
+"""
+
+_PAIR_MERGE_TAIL = """
+    for record in (r1, r2):
+        for field in record:
+            if field not in out and field not in SPECIAL_FIELDS:
+                out[field] = merge_value(r1.get(field), r2.get(field), prefer, s1, s2)
+
+    if "source" in r1 or "source" in r2:
+        out["source"] = f"{s1} + {s2}" if s1 and s2 else (s1 or s2 or "")
+
+    if "source_url" in r1 or "source_url" in r2:
+        v1 = r1.get("source_url")
+        v2 = r2.get("source_url")
+        out["source_url"] = f"{v1} | {v2}" if v1 and v2 else (v1 or v2 or "")
+
+    if "extracted_at" in r1 or "extracted_at" in r2:
+        v1 = r1.get("extracted_at")
+        v2 = r2.get("extracted_at")
+        out["extracted_at"] = max(v1, v2) if v1 and v2 else (v1 or v2 or "")
+
+    out["is_cross_source_merged"] = True
+    return out
+"""
+
+
+def build_pair_merger(fields: Tuple[str, ...] = REGULAR_FIELDS) -> Callable[..., Dict[str, Any]]:
+    """
+    Generate a straight-line record pair merge function for a schema.
+
+    Every schema field's merge rule is unrolled into the function body,
+    specialized by the field's type in FIELD_TYPES, so merging a typical
+    pair needs no per-field loop or method dispatch.
+
+    Args:
+        fields: Regular (non-special) fields to unroll
+
+    Returns:
+        Function (record1, record2, prefer_source, merge_value) -> merged record
+    """
+    source = (
+        "def merge_pair(r1, r2, prefer, merge_value):\n"
+        "    out = {}\n"
+        "    s1 = r1.get('source')\n"
+        "    s2 = r2.get('source')\n"
+        + "".join(
+            (_STR_FIELD_TEMPLATE if FIELD_TYPES.get(field) is str else _SCALAR_FIELD_TEMPLATE)
+            .format(field=repr(field))
+            for field in fields
+        )
+        + _PAIR_MERGE_TAIL
+    )
+
+    namespace = {"SPECIAL_FIELDS": SPECIAL_FIELDS, "_len": str.__len__}
+    exec(compile(source, "<pair_merger>", "exec"), namespace)
+
+    return namespace["merge_pair"]
+
+
 class PropertyMerger:
     """Merger for combining property records from multiple sources."""
 
     def __init__(self):
         """Initialize the merger."""
         self.logger = get_logger(__name__)
+        self._compiled_merge = build_pair_merger()
 
     def merge_sources(
         self,
@@ -39,11 +138,6 @@ class PropertyMerger:
             f"Merging {len(wake_records)} Wake County + {len(orange_records)} Orange County records"
         )
 
-        # Group records by merge key
-        wake_by_key = self._group_by_key(wake_records, merge_key)
-        orange_by_key = self._group_by_key(orange_records, merge_key)
-
-        merged_records = []
         stats = {
             "wake_only": 0,
             "orange_only": 0,
@@ -51,30 +145,59 @@ class PropertyMerger:
             "total": 0,
         }
 
-        # Get all unique keys
-        all_keys = set(wake_by_key.keys()) | set(orange_by_key.keys())
+        # Group records by merge key (records without a key are under None)
+        if wake_records and orange_records:
+            wake_by_key = self._group_by_key(wake_records, merge_key)
+            orange_by_key = self._group_by_key(orange_records, merge_key)
+            common_keys = (wake_by_key.keys() & orange_by_key.keys()) - {None}
+        else:
+            common_keys = set()
 
-        for key in all_keys:
-            wake_group = wake_by_key.get(key, [])
-            orange_group = orange_by_key.get(key, [])
+        if not common_keys:
+            # Nothing to join - every record is single-source
+            merged_records = [*wake_records, *orange_records]
+            stats["wake_only"] = len(wake_records)
+            stats["orange_only"] = len(orange_records)
 
-            if wake_group and orange_group:
-                # Records exist in both sources - merge them
-                for wake_rec in wake_group:
-                    for orange_rec in orange_group:
-                        merged = self.merge_record_pair(wake_rec, orange_rec)
-                        merged_records.append(merged)
+        else:
+            merged_records = []
+
+            # Records exist in both sources - merge them
+            for key in common_keys:
+                wake_group = wake_by_key[key]
+                orange_group = orange_by_key[key]
+
+                if len(wake_group) == 1 and len(orange_group) == 1:
+                    # Common case - one record per source
+                    merged_records.append(self.merge_record_pair(wake_group[0], orange_group[0]))
+                    stats["merged"] += 1
+                    continue
+
+                # Multiple records per source - pair them positionally so
+                # equivalent records line up, unmatched extras pass through
+                wake_group = sorted(wake_group, key=self._pairing_order)
+                orange_group = sorted(orange_group, key=self._pairing_order)
+
+                for wake_rec, orange_rec in zip_longest(wake_group, orange_group):
+                    if wake_rec is None:
+                        merged_records.append(orange_rec)
+                        stats["orange_only"] += 1
+                    elif orange_rec is None:
+                        merged_records.append(wake_rec)
+                        stats["wake_only"] += 1
+                    else:
+                        merged_records.append(self.merge_record_pair(wake_rec, orange_rec))
                         stats["merged"] += 1
 
-            elif wake_group:
-                # Only Wake County records
-                merged_records.extend(wake_group)
-                stats["wake_only"] += len(wake_group)
+            # Only Wake County records
+            for key in wake_by_key.keys() - common_keys:
+                merged_records.extend(wake_by_key[key])
+                stats["wake_only"] += len(wake_by_key[key])
 
-            elif orange_group:
-                # Only Orange County records
-                merged_records.extend(orange_group)
-                stats["orange_only"] += len(orange_group)
+            # Only Orange County records
+            for key in orange_by_key.keys() - common_keys:
+                merged_records.extend(orange_by_key[key])
+                stats["orange_only"] += len(orange_by_key[key])
 
         stats["total"] = len(merged_records)
 
@@ -86,6 +209,234 @@ class PropertyMerger:
 
         return merged_records, stats
 
+    def merge_sources_df(
+        self,
+        wake_records: List[Dict[str, Any]],
+        orange_records: List[Dict[str, Any]],
+        merge_key: str = "parcel_id"
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Merge records from both sources with a vectorized pandas join.
+
+        Produces the same pairing and field preferences as merge_sources,
+        but the join and per-field resolution run column-wise.
+
+        Args:
+            wake_records: Records from Wake County API
+            orange_records: Records from Orange County scraper
+            merge_key: Field to use for merging (default: parcel_id)
+
+        Returns:
+            Tuple of (merged_records, statistics)
+        """
+        self.logger.info(
+            f"Merging {len(wake_records)} Wake County + {len(orange_records)} Orange County records"
+        )
+
+        if not wake_records or not orange_records:
+            # Nothing to join - every record is single-source
+            return self.merge_sources(wake_records, orange_records, merge_key)
+
+        # object dtype keeps values exactly as they are in the records
+        wake_df = pd.DataFrame(wake_records, dtype=object)
+        orange_df = pd.DataFrame(orange_records, dtype=object)
+        wake_index = self._key_index(wake_df, merge_key)
+        orange_index = self._key_index(orange_df, merge_key)
+
+        # Pair records on (normalized key, position within key group)
+        joined = pd.merge(
+            wake_index,
+            orange_index,
+            on=["_key", "_rank"],
+            how="outer",
+            suffixes=("_w", "_o"),
+            indicator=True,
+        )
+
+        both = joined[joined["_merge"] == "both"]
+        # Unpaired and keyless records are single-source
+        wake_only = [
+            *joined.loc[joined["_merge"] == "left_only", "_idx_w"].astype(int),
+            *wake_df.index.difference(wake_index["_idx"]),
+        ]
+        orange_only = [
+            *joined.loc[joined["_merge"] == "right_only", "_idx_o"].astype(int),
+            *orange_df.index.difference(orange_index["_idx"]),
+        ]
+
+        merged_records = []
+
+        if not both.empty:
+            merged_df = self._merge_frames(
+                wake_df.loc[both["_idx_w"].astype(int)].reset_index(drop=True),
+                orange_df.loc[both["_idx_o"].astype(int)].reset_index(drop=True),
+            )
+            merged_df["is_cross_source_merged"] = True
+            merged_records.extend(merged_df.to_dict("records"))
+
+        # Single-source records pass through unchanged
+        merged_records.extend(wake_records[i] for i in wake_only)
+        merged_records.extend(orange_records[i] for i in orange_only)
+
+        stats = {
+            "wake_only": len(wake_only),
+            "orange_only": len(orange_only),
+            "merged": len(both),
+            "total": len(merged_records),
+        }
+
+        self.logger.info(
+            f"Merge complete: {stats['total']} total records "
+            f"({stats['wake_only']} Wake only, {stats['orange_only']} Orange only, "
+            f"{stats['merged']} merged)"
+        )
+
+        return merged_records, stats
+
+    def _key_index(self, frame: "pd.DataFrame", key: str) -> "pd.DataFrame":
+        """
+        Build the join index for a frame of records.
+
+        Args:
+            frame: Records as a DataFrame
+            key: Field name to join on
+
+        Returns:
+            DataFrame with normalized key, rank within key group and row position
+        """
+        if key not in frame.columns:
+            return pd.DataFrame({
+                "_key": pd.Series(dtype=object),
+                "_rank": pd.Series(dtype="int64"),
+                "_idx": pd.Series(dtype="int64"),
+            })
+
+        raw = frame[key]
+        has_key = raw.notna() & raw.astype(str).ne("")
+
+        index = pd.DataFrame({
+            "_key": raw.astype(str).str.strip().str.upper(),
+            "_idx": frame.index,
+        })
+        # Same ordering as _pairing_order
+        for field in ("extracted_at", "source_url"):
+            index[field] = frame[field].fillna("").astype(str) if field in frame.columns else ""
+
+        index = index[has_key].sort_values(["_key", "extracted_at", "source_url"], kind="stable")
+        index["_rank"] = index.groupby("_key").cumcount()
+
+        return index[["_key", "_rank", "_idx"]]
+
+    def _merge_frames(self, left: "pd.DataFrame", right: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Merge two row-aligned frames column-wise.
+
+        Mirrors merge_record_pair with no preferred source.
+
+        Args:
+            left: Wake County records
+            right: Orange County records, aligned with left
+
+        Returns:
+            DataFrame of merged records
+        """
+        merged = pd.DataFrame(index=left.index)
+
+        for field in list(dict.fromkeys([*left.columns, *right.columns])):
+            value1 = left[field] if field in left.columns else pd.Series(None, index=left.index, dtype=object)
+            value2 = right[field] if field in right.columns else pd.Series(None, index=right.index, dtype=object)
+
+            if field == "source":
+                merged[field] = self._join_columns(value1, value2, " + ")
+
+            elif field == "source_url":
+                merged[field] = self._join_columns(value1, value2, " | ")
+
+            elif field == "extracted_at":
+                # Use most recent extraction time
+                value1 = value1.fillna("").astype(str)
+                value2 = value2.fillna("").astype(str)
+                merged[field] = value1.where(value1.ge(value2), value2)
+
+            else:
+                merged[field] = self._pick_longer(
+                    value1.to_numpy(dtype=object), value2.to_numpy(dtype=object)
+                )
+
+        return merged
+
+    @staticmethod
+    def _join_columns(value1: "pd.Series", value2: "pd.Series", sep: str) -> "pd.Series":
+        """
+        Join two string columns, skipping empty values.
+
+        Args:
+            value1: First column
+            value2: Second column
+            sep: Separator used when both values are present
+
+        Returns:
+            Joined column
+        """
+        value1 = value1.fillna("").astype(str)
+        value2 = value2.fillna("").astype(str)
+        both = value1.ne("") & value2.ne("")
+
+        return value1.str.cat(value2, sep=sep).where(both, value1 + value2)
+
+    @staticmethod
+    def _value_lengths(values: "np.ndarray") -> "np.ndarray":
+        """
+        Length codes for a value column, computed column-wise.
+
+        Args:
+            values: Values (object array)
+
+        Returns:
+            Integer array: string length, -1 for empty values (None, NaN,
+            blank strings), -2 for other non-empty values
+        """
+        column = pd.Series(values, dtype=object)
+        missing = column.isna().to_numpy()
+
+        # A value is a string iff it equals its own str() conversion
+        text = column.astype(str)
+        is_str = (text.to_numpy(dtype=object) == values) & ~missing
+        lengths = text.str.len().to_numpy()
+        blank = text.str.strip().eq("").to_numpy()
+
+        return np.where(missing | (is_str & blank), -1, np.where(is_str, lengths, -2))
+
+    @classmethod
+    def _pick_longer(cls, value1: "np.ndarray", value2: "np.ndarray") -> "np.ndarray":
+        """
+        Merge two aligned value columns with the _merge_field_values rules.
+
+        Prefers the non-empty value, then the longer string, then the first
+        value. String lengths are computed column-wise (_value_lengths), so
+        the selection itself is integer/boolean array work.
+
+        Args:
+            value1: Values from the first records (object array)
+            value2: Values from the second records (object array)
+
+        Returns:
+            Object array of merged values
+        """
+        lens1 = cls._value_lengths(value1)
+        lens2 = cls._value_lengths(value2)
+
+        empty1 = lens1 == -1
+        empty2 = lens2 == -1
+        both_str = (lens1 >= 0) & (lens2 >= 0)
+
+        use2 = (empty1 & ~empty2) | (both_str & (lens1 < lens2))
+
+        merged = np.where(use2, value2, value1)
+        merged[empty1 & empty2] = ""
+
+        return merged
+
     def _group_by_key(
         self,
         records: List[Dict[str, Any]],
@@ -100,19 +451,38 @@ class PropertyMerger:
 
         Returns:
             Dictionary mapping key values to lists of records
+            (records without a key value are grouped under None)
         """
         grouped = defaultdict(list)
+        get_group = grouped.__getitem__
+        # Cleaned records carry the normalized parcel_id
+        use_cached = key == "parcel_id"
 
         for record in records:
-            key_value = record.get(key)
+            key_normalized = record.get("_parcel_key") if use_cached else None
+
+            if key_normalized is None:
+                key_value = record.get(key)
+                if key_value:
+                    key_normalized = str(key_value).strip().upper()
 
-            if key_value:
-                # Normalize key value
-                key_normalized = str(key_value).strip().upper()
-                grouped[key_normalized].append(record)
+            get_group(key_normalized).append(record)
 
         return grouped
 
+    @staticmethod
+    def _pairing_order(record: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Sort key used to line up records from two sources for pairing.
+
+        Args:
+            record: Property record
+
+        Returns:
+            Tuple of (extracted_at, source_url)
+        """
+        return (record.get("extracted_at") or "", record.get("source_url") or "")
+
     def merge_record_pair(
         self,
         record1: Dict[str, Any],
@@ -135,53 +505,7 @@ class PropertyMerger:
         Returns:
             Merged property record
         """
-        merged = {}
-
-        # Get all unique fields
-        all_fields = set(record1.keys()) | set(record2.keys())
-
-        for field in all_fields:
-            value1 = record1.get(field)
-            value2 = record2.get(field)
-
-            # Handle special fields
-            if field == "source":
-                # Combine sources
-                sources = []
-                if value1:
-                    sources.append(value1)
-                if value2:
-                    sources.append(value2)
-                merged[field] = " + ".join(sources) if sources else ""
-                continue
-
-            elif field == "source_url":
-                # Combine URLs
-                urls = []
-                if value1:
-                    urls.append(value1)
-                if value2:
-                    urls.append(value2)
-                merged[field] = " | ".join(urls) if urls else ""
-                continue
-
-            elif field == "extracted_at":
-                # Use most recent extraction time
-                if value1 and value2:
-                    merged[field] = max(value1, value2)
-                else:
-                    merged[field] = value1 or value2 or ""
-                continue
-
-            # For regular fields, merge values
-            merged[field] = self._merge_field_values(
-                value1, value2, prefer_source, record1.get("source"), record2.get("source")
-            )
-
-        # Add merge metadata
-        merged["is_cross_source_merged"] = True
-
-        return merged
+        return self._compiled_merge(record1, record2, prefer_source, self._merge_field_values)
 
     def _merge_field_values(
         self,
@@ -242,11 +566,7 @@ class PropertyMerger:
         Returns:
             Combined list of all records
         """
-        combined = []
-
-        for record_list in record_lists:
-            if record_list:
-                combined.extend(record_list)
+        combined = list(chain.from_iterable(filter(None, record_lists)))
 
         self.logger.info(f"Combined {len(record_lists)} lists into {len(combined)} total records")
 
@@ -267,9 +587,10 @@ class PropertyMerger:
         """
         by_source = defaultdict(list)
 
+        get_group = by_source.__getitem__
+
         for record in records:
-            source = record.get("source", "Unknown")
-            by_source[source].append(record)
+            get_group(record.get("source", "Unknown")).append(record)
 
         return dict(by_source)
 
@@ -310,13 +631,14 @@ class PropertyMerger:
         """
         total = len(records)
 
-        # Count by source
-        by_source = self.separate_by_source(records)
-        source_counts = {source: len(recs) for source, recs in by_source.items()}
+        # Count by source and cross-source merges in a single pass
+        source_counts = Counter()
+        cross_source_count = 0
 
-        # Count cross-source merges
-        cross_source = self.get_cross_source_records(records)
-        cross_source_count = len(cross_source)
+        for record in records:
+            source_counts[record.get("source", "Unknown")] += 1
+            if record.get("is_cross_source_merged", False):
+                cross_source_count += 1
 
         # Count single-source records
         single_source_count = total - cross_source_count
@@ -325,5 +647,5 @@ class PropertyMerger:
             "total_records": total,
             "single_source": single_source_count,
             "cross_source_merged": cross_source_count,
-            "by_source": source_counts,
+            "by_source": dict(source_counts),
         }
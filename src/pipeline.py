@@ -3,18 +3,24 @@ Main pipeline orchestration module.
 
 This module coordinates all stages of the property data extraction pipeline:
 1. Data Fetching (API + Scraping)
-2. Validation
-3. Cleaning/Normalization
-4. Deduplication
-5. Merging
+2. Validation & Cleaning/Normalization (single pass)
+3. Deduplication (per source)
+4. Merging
+5. Deduplication (cross-source)
 6. Enrichment
 7. Export
 """
 
-from typing import Dict, List, Any, Optional
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from config.settings import PIPELINE_CONFIG, ENV_CONFIG
 from src.fetchers.api_fetcher import WakeCountyAPIFetcher
 from src.fetchers.orange_scraper import OrangeCountyScraper
@@ -71,6 +77,10 @@ class PropertyPipeline:
             "duration_seconds": 0,
             "stages": {},
         }
+        self._t0 = None
+        self._t1 = None
+        self._checkpoint_pool = None
+        self._checkpoint_futures = []
 
         self.logger.info("Pipeline initialized")
 
@@ -93,25 +103,41 @@ class PropertyPipeline:
         """
         with Timer("Complete pipeline", self.logger):
             self.statistics["pipeline_started"] = datetime.now().isoformat()
+            self._t0 = time.perf_counter()
+
+            # Checkpoints are written in the background while the next stage runs
+            self._checkpoint_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+            self._checkpoint_futures = []
 
             try:
                 # Stage 1: Data Fetching
                 wake_records, orange_records = self._stage_fetch_data(api_limit, scraper_limit)
 
-                # Stage 2: Validation
-                wake_records, orange_records = self._stage_validate(wake_records, orange_records)
+                # Stage 2: Validation & Cleaning
+                wake_records, orange_records = self._stage_validate_and_clean(
+                    wake_records, orange_records
+                )
 
-                # Stage 3: Cleaning
-                wake_records, orange_records = self._stage_clean(wake_records, orange_records)
+                # Stage 3: Per-source deduplication
+                wake_records, orange_records, source_duplicates = self._stage_deduplicate_sources(
+                    wake_records, orange_records
+                )
 
                 # Stage 4: Merging
                 all_records, merge_stats = self._stage_merge(wake_records, orange_records)
 
-                # Stage 5: Deduplication
+                # Only the Excel export needs the per-source records
+                if output_format != "excel":
+                    wake_records = orange_records = []
+
+                # Stage 5: Cross-source deduplication
                 deduplicated_records, duplicates = self._stage_deduplicate(all_records)
+                duplicates = source_duplicates + duplicates
+                del all_records
 
                 # Stage 6: Enrichment
                 enriched_records = self._stage_enrich(deduplicated_records)
+                del deduplicated_records
 
                 # Stage 7: Export
                 output_path = self._stage_export(
@@ -122,8 +148,12 @@ class PropertyPipeline:
                     output_format
                 )
 
+                # A failed checkpoint write fails the run, as it did when writes were synchronous
+                self._wait_for_checkpoints()
+
                 # Finalize statistics
                 self.statistics["pipeline_completed"] = datetime.now().isoformat()
+                self._t1 = time.perf_counter()
                 self._calculate_final_stats(enriched_records, duplicates)
 
                 self.logger.info("Pipeline completed successfully!")
@@ -138,6 +168,7 @@ class PropertyPipeline:
             except Exception as e:
                 self.logger.error(f"Pipeline failed: {e}", exc_info=True)
                 self.statistics["pipeline_completed"] = datetime.now().isoformat()
+                self._t1 = time.perf_counter()
                 self.statistics["error"] = str(e)
 
                 return {
@@ -146,6 +177,10 @@ class PropertyPipeline:
                     "statistics": self.statistics,
                 }
 
+            finally:
+                # Make sure every queued checkpoint is on disk
+                self._checkpoint_pool.shutdown(wait=True)
+
     def _generate_test_data(
         self,
         api_limit: Optional[int],
@@ -157,64 +192,72 @@ class PropertyPipeline:
         wake_count = api_limit or 10
         orange_count = scraper_limit or 5
 
-        wake_records = []
-        for i in range(wake_count):
-            wake_records.append({
-                "owner_name": f"John Smith {i}",
-                "parcel_id": f"WK-{1000 + i}",
-                "property_address": f"{100 + i} Main St",
-                "city": "Raleigh",
-                "state": "NC",
-                "zip_code": "27601",
-                "county": "Wake",
-                "mailing_address": f"{100 + i} Main St, Raleigh NC 27601",
-                "assessed_value": 250000 + (i * 10000),
-                "sale_date": "2024-01-15",
-                "sale_price": 280000 + (i * 10000),
-                "source": "Wake County API (TEST)",
-                "source_url": "https://test.example.com",
-                "extracted_at": datetime.now().isoformat(),
-            })
-
-        orange_records = []
-        for i in range(orange_count):
-            # Create some duplicates for testing
-            if i < 2:
-                # Duplicate with slight variations
-                orange_records.append({
-                    "owner_name": f"John Smith {i}",
-                    "parcel_id": f"WK-{1000 + i}",
-                    "property_address": f"{100 + i} Main Street",
-                    "city": "Raleigh",
-                    "state": "NC",
-                    "zip_code": "27601",
-                    "county": "Orange",
-                    "mailing_address": "",
-                    "assessed_value": 255000 + (i * 10000),
-                    "sale_date": "",
-                    "sale_price": "",
-                    "source": "Orange County Scraper (TEST)",
-                    "source_url": "https://test.example.com",
-                    "extracted_at": datetime.now().isoformat(),
-                })
-            else:
-                # Unique Orange County records
-                orange_records.append({
-                    "owner_name": f"Jane Doe {i}",
-                    "parcel_id": f"OR-{2000 + i}",
-                    "property_address": f"{200 + i} Chapel Hill Rd",
-                    "city": "Chapel Hill",
-                    "state": "NC",
-                    "zip_code": "27514",
-                    "county": "Orange",
-                    "mailing_address": f"{200 + i} Chapel Hill Rd, Chapel Hill NC 27514",
-                    "assessed_value": 300000 + (i * 15000),
-                    "sale_date": "2024-02-20",
-                    "sale_price": 320000 + (i * 15000),
-                    "source": "Orange County Scraper (TEST)",
-                    "source_url": "https://test.example.com",
-                    "extracted_at": datetime.now().isoformat(),
-                })
+        extracted_at = datetime.now().isoformat()
+
+        # Build each column in one vectorized operation, then convert to records
+        idx = np.arange(wake_count)
+        numbers = (100 + idx).astype(str)
+        streets = np.char.add(numbers, " Main St")
+
+        wake_records = pd.DataFrame({
+            "owner_name": np.char.add("John Smith ", idx.astype(str)),
+            "parcel_id": np.char.add("WK-", (1000 + idx).astype(str)),
+            "property_address": streets,
+            "city": "Raleigh",
+            "state": "NC",
+            "zip_code": "27601",
+            "county": "Wake",
+            "mailing_address": np.char.add(streets, ", Raleigh NC 27601"),
+            "assessed_value": 250000 + idx * 10000,
+            "sale_date": "2024-01-15",
+            "sale_price": 280000 + idx * 10000,
+            "source": "Wake County API (TEST)",
+            "source_url": "https://test.example.com",
+            "extracted_at": extracted_at,
+        }).to_dict(orient="records")
+
+        # The first two Orange records duplicate Wake records with slight variations
+        idx = np.arange(min(orange_count, 2))
+
+        duplicate_records = pd.DataFrame({
+            "owner_name": np.char.add("John Smith ", idx.astype(str)),
+            "parcel_id": np.char.add("WK-", (1000 + idx).astype(str)),
+            "property_address": np.char.add((100 + idx).astype(str), " Main Street"),
+            "city": "Raleigh",
+            "state": "NC",
+            "zip_code": "27601",
+            "county": "Orange",
+            "mailing_address": "",
+            "assessed_value": 255000 + idx * 10000,
+            "sale_date": "",
+            "sale_price": "",
+            "source": "Orange County Scraper (TEST)",
+            "source_url": "https://test.example.com",
+            "extracted_at": extracted_at,
+        }).to_dict(orient="records")
+
+        # Unique Orange County records
+        idx = np.arange(2, max(orange_count, 2))
+        streets = np.char.add((200 + idx).astype(str), " Chapel Hill Rd")
+
+        unique_records = pd.DataFrame({
+            "owner_name": np.char.add("Jane Doe ", idx.astype(str)),
+            "parcel_id": np.char.add("OR-", (2000 + idx).astype(str)),
+            "property_address": streets,
+            "city": "Chapel Hill",
+            "state": "NC",
+            "zip_code": "27514",
+            "county": "Orange",
+            "mailing_address": np.char.add(streets, ", Chapel Hill NC 27514"),
+            "assessed_value": 300000 + idx * 15000,
+            "sale_date": "2024-02-20",
+            "sale_price": 320000 + idx * 15000,
+            "source": "Orange County Scraper (TEST)",
+            "source_url": "https://test.example.com",
+            "extracted_at": extracted_at,
+        }).to_dict(orient="records")
+
+        orange_records = duplicate_records + unique_records
 
         self.logger.info(f"Generated {len(wake_records)} Wake + {len(orange_records)} Orange test records")
         return wake_records, orange_records
@@ -234,9 +277,7 @@ class PropertyPipeline:
         Returns:
             Tuple of (wake_records, orange_records)
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 1: Data Fetching")
-        self.logger.info("=" * 60)
+        self._log_stage("STAGE 1: Data Fetching")
 
         wake_records = []
         orange_records = []
@@ -245,41 +286,38 @@ class PropertyPipeline:
         if self.use_test_data:
             return self._generate_test_data(api_limit, scraper_limit)
 
-        # Fetch from Wake County API
-        if self.enable_api:
-            try:
-                with WakeCountyAPIFetcher() as api_fetcher:
-                    wake_records = api_fetcher.fetch_and_normalize(limit=api_limit)
-                    api_fetcher.save_raw_data(wake_records)
+        # Both sources are network-bound on different hosts - fetch concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {}
 
-                    self.statistics["stages"]["fetch_api"] = {
-                        "records_fetched": len(wake_records),
-                        "statistics": api_fetcher.get_statistics(),
-                    }
+            if self.enable_api:
+                futures[executor.submit(self._fetch_api, api_limit)] = "fetch_api"
 
-            except Exception as e:
-                self.logger.error(f"API fetching failed: {e}")
-                self.statistics["stages"]["fetch_api"] = {"error": str(e)}
+            if self.enable_scraping:
+                futures[executor.submit(self._fetch_scraper, scraper_limit)] = "fetch_scraper"
 
-        # Scrape from Orange County
-        if self.enable_scraping:
-            try:
-                with OrangeCountyScraper() as scraper:
-                    orange_records = scraper.scrape_and_normalize(max_records=scraper_limit)
-                    scraper.save_raw_data(orange_records)
+            # Statistics are recorded here, on the pipeline thread
+            for future in as_completed(futures):
+                stage = futures[future]
 
-                    self.statistics["stages"]["fetch_scraper"] = {
-                        "records_scraped": len(orange_records),
-                        "statistics": scraper.get_statistics(),
-                    }
+                try:
+                    records, stage_stats = future.result()
+                except Exception as e:
+                    source = "API fetching" if stage == "fetch_api" else "Scraping"
+                    self.logger.error(f"{source} failed: {e}")
+                    self.statistics["stages"][stage] = {"error": str(e)}
+                    continue
 
-            except Exception as e:
-                self.logger.error(f"Scraping failed: {e}")
-                self.statistics["stages"]["fetch_scraper"] = {"error": str(e)}
+                self.statistics["stages"][stage] = stage_stats
+
+                if stage == "fetch_api":
+                    wake_records = records
+                else:
+                    orange_records = records
 
         # Checkpoint
         if self.enable_checkpoints:
-            save_checkpoint(
+            self._checkpoint(
                 {"wake_records": wake_records, "orange_records": orange_records},
                 "01_fetched_data"
             )
@@ -288,51 +326,63 @@ class PropertyPipeline:
 
         return wake_records, orange_records
 
-    def _stage_validate(
+    def _fetch_api(
         self,
-        wake_records: List[Dict[str, Any]],
-        orange_records: List[Dict[str, Any]]
-    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        api_limit: Optional[int]
+    ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
-        Stage 2: Validate records.
+        Fetch records from the Wake County API.
 
         Args:
-            wake_records: Wake County records
-            orange_records: Orange County records
+            api_limit: API record limit
 
         Returns:
-            Tuple of (validated_wake_records, validated_orange_records)
+            Tuple of (wake_records, fetch_statistics)
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 2: Validation")
-        self.logger.info("=" * 60)
+        with WakeCountyAPIFetcher() as api_fetcher:
+            wake_records = api_fetcher.fetch_and_normalize(limit=api_limit)
 
-        # Validate Wake County records
-        wake_valid = self.validator.filter_valid_records(wake_records, strict=False)
+            # The fetch checkpoint already stores these records
+            if not self.enable_checkpoints:
+                api_fetcher.save_raw_data(wake_records)
 
-        # Validate Orange County records
-        orange_valid = self.validator.filter_valid_records(orange_records, strict=False)
+            return wake_records, {
+                "records_fetched": len(wake_records),
+                "statistics": api_fetcher.get_statistics(),
+            }
 
-        self.statistics["stages"]["validation"] = {
-            "wake_valid": len(wake_valid),
-            "wake_invalid": len(wake_records) - len(wake_valid),
-            "orange_valid": len(orange_valid),
-            "orange_invalid": len(orange_records) - len(orange_valid),
-        }
+    def _fetch_scraper(
+        self,
+        scraper_limit: Optional[int]
+    ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Scrape records from Orange County.
 
-        self.logger.info(
-            f"Validation complete: {len(wake_valid)} Wake + {len(orange_valid)} Orange valid"
-        )
+        Args:
+            scraper_limit: Scraper record limit
+
+        Returns:
+            Tuple of (orange_records, scrape_statistics)
+        """
+        with OrangeCountyScraper() as scraper:
+            orange_records = scraper.scrape_and_normalize(max_records=scraper_limit)
+
+            # The fetch checkpoint already stores these records
+            if not self.enable_checkpoints:
+                scraper.save_raw_data(orange_records)
 
-        return wake_valid, orange_valid
+            return orange_records, {
+                "records_scraped": len(orange_records),
+                "statistics": scraper.get_statistics(),
+            }
 
-    def _stage_clean(
+    def _stage_validate_and_clean(
         self,
         wake_records: List[Dict[str, Any]],
         orange_records: List[Dict[str, Any]]
     ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Stage 3: Clean and normalize records.
+        Stage 2: Validate, then clean and normalize, records in a single pass.
 
         Args:
             wake_records: Wake County records
@@ -341,15 +391,17 @@ class PropertyPipeline:
         Returns:
             Tuple of (cleaned_wake_records, cleaned_orange_records)
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 3: Cleaning & Normalization")
-        self.logger.info("=" * 60)
+        self._log_stage("STAGE 2: Validation & Cleaning")
 
-        # Clean Wake County records
-        wake_cleaned = self.cleaner.clean_batch(wake_records)
+        wake_cleaned, wake_invalid = self._validate_and_clean(wake_records)
+        orange_cleaned, orange_invalid = self._validate_and_clean(orange_records)
 
-        # Clean Orange County records
-        orange_cleaned = self.cleaner.clean_batch(orange_records)
+        self.statistics["stages"]["validation"] = {
+            "wake_valid": len(wake_cleaned),
+            "wake_invalid": wake_invalid,
+            "orange_valid": len(orange_cleaned),
+            "orange_invalid": orange_invalid,
+        }
 
         self.statistics["stages"]["cleaning"] = {
             "wake_cleaned": len(wake_cleaned),
@@ -358,17 +410,98 @@ class PropertyPipeline:
 
         # Checkpoint
         if self.enable_checkpoints:
-            save_checkpoint(
+            self._checkpoint(
                 {"wake_records": wake_cleaned, "orange_records": orange_cleaned},
                 "02_cleaned_data"
             )
 
         self.logger.info(
-            f"Cleaning complete: {len(wake_cleaned)} Wake + {len(orange_cleaned)} Orange"
+            f"Validation & cleaning complete: {len(wake_cleaned)} Wake + "
+            f"{len(orange_cleaned)} Orange valid"
         )
 
         return wake_cleaned, orange_cleaned
 
+    def _validate_and_clean(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """
+        Drop invalid records and clean the valid ones in one loop.
+
+        Args:
+            records: Records from one source (emptied as they are processed)
+
+        Returns:
+            Tuple of (cleaned_records, invalid_count)
+        """
+        cleaned_records = []
+        invalid_count = 0
+
+        # Raw records are released as their cleaned copies are built
+        for record in self._consume(records):
+            is_valid, errors = self.validator.validate_record(record, strict=False)
+
+            if not is_valid:
+                invalid_count += 1
+                # Log first few errors for debugging
+                if invalid_count <= 3:
+                    self.logger.debug(f"Invalid record errors: {errors}")
+                continue
+
+            cleaned_records.append(self.cleaner.clean_record_for_merge(record))
+
+        if invalid_count:
+            self.logger.warning(f"Filtered out {invalid_count} invalid records")
+
+        return cleaned_records, invalid_count
+
+    def _stage_deduplicate_sources(
+        self,
+        wake_records: List[Dict[str, Any]],
+        orange_records: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Stage 3: Deduplicate each source before merging.
+
+        Args:
+            wake_records: Wake County records
+            orange_records: Orange County records
+
+        Returns:
+            Tuple of (wake_records, orange_records, duplicate_records)
+        """
+        self._log_stage("STAGE 3: Deduplication (per source)")
+
+        wake_deduplicated, wake_duplicates, wake_groups = self.deduplicator.deduplicate_within_source(
+            wake_records, return_groups=True
+        )
+        orange_deduplicated, orange_duplicates, orange_groups = self.deduplicator.deduplicate_within_source(
+            orange_records, return_groups=True
+        )
+
+        self.statistics["stages"]["source_deduplication"] = {
+            "wake_input": len(wake_records),
+            "wake_unique": len(wake_deduplicated),
+            "orange_input": len(orange_records),
+            "orange_unique": len(orange_deduplicated),
+            "duplicate_groups": len(wake_groups) + len(orange_groups),
+        }
+
+        # Checkpoint
+        if self.enable_checkpoints:
+            self._checkpoint(
+                {"wake_records": wake_deduplicated, "orange_records": orange_deduplicated},
+                "03_source_deduplicated_data"
+            )
+
+        self.logger.info(
+            f"Per-source deduplication complete: {len(wake_deduplicated)} Wake + "
+            f"{len(orange_deduplicated)} Orange"
+        )
+
+        return wake_deduplicated, orange_deduplicated, wake_duplicates + orange_duplicates
+
     def _stage_merge(
         self,
         wake_records: List[Dict[str, Any]],
@@ -384,12 +517,13 @@ class PropertyPipeline:
         Returns:
             Tuple of (merged_records, merge_statistics)
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 4: Merging")
-        self.logger.info("=" * 60)
+        self._log_stage("STAGE 4: Merging")
 
         # Merge records
-        merged_records, merge_stats = self.merger.merge_sources(wake_records, orange_records)
+        if PIPELINE_CONFIG.get("vectorized_merge", False):
+            merged_records, merge_stats = self.merger.merge_sources_df(wake_records, orange_records)
+        else:
+            merged_records, merge_stats = self.merger.merge_sources(wake_records, orange_records)
 
         self.statistics["stages"]["merging"] = merge_stats
 
@@ -402,7 +536,7 @@ class PropertyPipeline:
         records: List[Dict[str, Any]]
     ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Stage 5: Deduplicate records.
+        Stage 5: Deduplicate merged records across sources.
 
         Args:
             records: All records
@@ -410,32 +544,34 @@ class PropertyPipeline:
         Returns:
             Tuple of (deduplicated_records, duplicate_records)
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 5: Deduplication")
-        self.logger.info("=" * 60)
+        self._log_stage("STAGE 5: Deduplication (cross-source)")
 
         # Deduplicate
-        deduplicated, duplicates = self.deduplicator.deduplicate_and_merge(
+        deduplicated, duplicates, duplicate_groups = self.deduplicator.deduplicate_across_sources(
             records,
-            merge_strategy="most_complete"
+            merge_strategy="most_complete",
+            return_groups=True
         )
 
         # Get duplicate statistics
-        unique_records, duplicate_groups = self.deduplicator.find_duplicates(records)
         dedup_stats = self.deduplicator.get_duplicate_statistics(duplicate_groups)
 
         self.statistics["stages"]["deduplication"] = {
             "input_records": len(records),
             "unique_records": len(deduplicated),
             "duplicates_removed": len(duplicates),
-            "duplicate_groups": dedup_stats.get("total_groups", 0),
+            # Per-source groups (stage 3) plus the cross-source groups found here
+            "duplicate_groups": (
+                self.statistics["stages"].get("source_deduplication", {}).get("duplicate_groups", 0)
+                + dedup_stats.get("total_groups", 0)
+            ),
         }
 
         # Checkpoint
         if self.enable_checkpoints:
-            save_checkpoint(
+            self._checkpoint(
                 {"deduplicated": deduplicated, "duplicates": duplicates},
-                "03_deduplicated_data"
+                "04_deduplicated_data"
             )
 
         self.logger.info(
@@ -452,17 +588,16 @@ class PropertyPipeline:
         Stage 6: Enrich records with quality scores.
 
         Args:
-            records: Deduplicated records
+            records: Deduplicated records (emptied as they are enriched)
 
         Returns:
             Enriched records
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 6: Enrichment")
-        self.logger.info("=" * 60)
+        self._log_stage("STAGE 6: Enrichment")
 
-        # Enrich records
-        enriched = self.enricher.enrich_batch(records)
+        # Enrich records, streaming them out of the deduplicated list so
+        # only one copy of the record set is held at a time
+        enriched = self.enricher.enrich_batch(self._consume(records))
 
         # Get quality distribution
         quality_dist = self.enricher.get_quality_distribution(enriched)
@@ -474,7 +609,7 @@ class PropertyPipeline:
 
         # Checkpoint
         if self.enable_checkpoints:
-            save_checkpoint(enriched, "04_enriched_data")
+            self._checkpoint(enriched, "05_enriched_data")
 
         self.logger.info(f"Enrichment complete: {len(enriched)} records enriched")
 
@@ -501,9 +636,7 @@ class PropertyPipeline:
         Returns:
             Path to output file
         """
-        self.logger.info("=" * 60)
-        self.logger.info("STAGE 7: Export")
-        self.logger.info("=" * 60)
+        self._log_stage("STAGE 7: Export")
 
         # Export based on format
         if output_format == "excel":
@@ -530,6 +663,74 @@ class PropertyPipeline:
 
         return output_path
 
+    @staticmethod
+    def _consume(records: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records in order while removing them from the list.
+
+        Once a stage has turned a record into a new one, the input record is
+        no longer referenced by the pipeline and can be freed, instead of the
+        whole input list staying alive until the stage returns.
+
+        Args:
+            records: Record list to drain
+
+        Yields:
+            Records in their original order
+        """
+        records.reverse()
+
+        while records:
+            yield records.pop()
+
+    def _log_stage(self, title: str):
+        """
+        Log a stage banner as a single log record.
+
+        Args:
+            title: Stage title
+        """
+        self.logger.info(f"{'=' * 60}\n{title}\n{'=' * 60}")
+
+    def _checkpoint(self, data: Any, checkpoint_name: str):
+        """
+        Queue a checkpoint on the background writer.
+
+        Record lists are snapshotted first, so later stages can rebind or
+        extend them while the checkpoint is being written.
+
+        Args:
+            data: Record list, or dict of record lists, to save
+            checkpoint_name: Name of the checkpoint file
+        """
+        if isinstance(data, dict):
+            snapshot = {key: list(value) for key, value in data.items()}
+        else:
+            snapshot = list(data)
+
+        self._checkpoint_futures.append(
+            self._checkpoint_pool.submit(self._write_checkpoint, snapshot, checkpoint_name)
+        )
+
+    def _wait_for_checkpoints(self):
+        """Wait for queued checkpoints and re-raise the first write error."""
+        futures, self._checkpoint_futures = self._checkpoint_futures, []
+        wait(futures)
+
+        for future in futures:
+            future.result()
+
+    def _write_checkpoint(self, data: Any, checkpoint_name: str):
+        """
+        Save a checkpoint and release the serialization garbage.
+
+        Args:
+            data: Data to save
+            checkpoint_name: Name of the checkpoint file
+        """
+        save_checkpoint(data, checkpoint_name)
+        gc.collect()
+
     def _calculate_final_stats(
         self,
         final_records: List[Dict[str, Any]],
@@ -542,10 +743,8 @@ class PropertyPipeline:
             final_records: Final enriched records
             duplicates: Duplicate records
         """
-        # Calculate duration
-        start_time = datetime.fromisoformat(self.statistics["pipeline_started"])
-        end_time = datetime.fromisoformat(self.statistics["pipeline_completed"])
-        duration = (end_time - start_time).total_seconds()
+        # Calculate duration (monotonic clock, ISO timestamps are for reporting)
+        duration = self._t1 - self._t0
 
         self.statistics["duration_seconds"] = round(duration, 2)
         self.statistics["total_output_records"] = len(final_records)
@@ -8,14 +8,42 @@ used throughout the application.
 import logging
 import logging.config
 import json
+import functools
 import hashlib
+import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import sys
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from config.settings import LOGGING_CONFIG, CHECKPOINT_DIR
 
+# Module logger, bound once for the checkpoint helpers
+_LOGGER = logging.getLogger(__name__)
+
+# Rows per Parquet row group; longer record lists are converted and written chunk by chunk
+CHECKPOINT_CHUNK_ROWS = 50_000
+
 
 # =======================
 # Logging Setup
@@ -65,22 +93,52 @@ def save_checkpoint(data: Any, checkpoint_name: str) -> Path:
     """
     Save pipeline checkpoint to disk.
 
+    Record lists (and dicts of record lists) are written as zstd-compressed
+    Parquet when pyarrow is available, one file per dict key. Anything else,
+    or records Arrow cannot type consistently, is written as JSON (compact
+    via orjson when available).
+
     Args:
         data: Data to save (must be JSON-serializable)
         checkpoint_name: Name of the checkpoint file
 
     Returns:
-        Path to saved checkpoint file
+        Path to saved checkpoint file (the first file for dict payloads)
     """
-    logger = get_logger(__name__)
+    logger = _LOGGER
 
-    # Create checkpoint filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_name}_{timestamp}.json"
+    # Create checkpoint filename with a nanosecond timestamp (unique across back-to-back saves)
+    timestamp = f"{time.time_ns():x}"
+    checkpoint_stem = f"{checkpoint_name}_{timestamp}"
 
     try:
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        tables = _records_to_tables(data)
+
+        if tables:
+            paths = []
+            records_by_key = data if isinstance(data, dict) else {"": data}
+
+            for key, table in tables.items():
+                suffix = f".{key}.parquet" if key else ".parquet"
+                checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_stem}{suffix}"
+                _write_parquet(records_by_key[key], table, checkpoint_file)
+                paths.append(checkpoint_file)
+
+            logger.info(f"Checkpoint saved: {', '.join(str(path) for path in paths)}")
+            return paths[0]
+
+        checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_stem}.json"
+        if ORJSON_AVAILABLE:
+            checkpoint_file.write_bytes(
+                orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        else:
+            with open(checkpoint_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, default=str)
 
         logger.info(f"Checkpoint saved: {checkpoint_file}")
         return checkpoint_file
@@ -90,6 +148,119 @@ def save_checkpoint(data: Any, checkpoint_name: str) -> Path:
         raise
 
 
+def _records_to_tables(data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Convert a checkpoint payload to Arrow tables, if it holds records.
+
+    Record lists longer than CHECKPOINT_CHUNK_ROWS are not converted in one
+    go; only their unified schema is kept, and _write_parquet converts them
+    chunk by chunk.
+
+    Args:
+        data: Record list, or dict of record lists
+
+    Returns:
+        Dictionary mapping dict key ("" for a plain list) to a table (or a
+        schema, for chunked lists), or None if the payload should be written as JSON
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+
+    if isinstance(data, list):
+        payload = {"": data}
+    elif isinstance(data, dict) and data:
+        payload = data
+    else:
+        return None
+
+    # Only lists of dicts go to Parquet (and at least one record overall)
+    for records in payload.values():
+        if not (isinstance(records, list) and all(isinstance(r, dict) for r in records)):
+            return None
+
+    if not any(payload.values()):
+        return None
+
+    try:
+        return {
+            key: (
+                _records_table(records)
+                if len(records) <= CHECKPOINT_CHUNK_ROWS
+                else _infer_chunked_schema(records)
+            )
+            for key, records in payload.items()
+        }
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        _LOGGER.debug(f"Records not Arrow-compatible, using JSON: {e}")
+        return None
+
+
+def _records_table(records: List[Dict[str, Any]]) -> "pa.Table":
+    """
+    Build an Arrow table with a column for every key in any record.
+
+    pa.Table.from_pylist only takes columns from the first record, which
+    would drop fields such as is_cross_source_merged that only some records have.
+
+    Args:
+        records: Property records
+
+    Returns:
+        Arrow table (missing fields are null)
+    """
+    columns = dict.fromkeys(key for record in records for key in record)
+
+    return pa.Table.from_pydict({
+        column: [record.get(column) for record in records] for column in columns
+    })
+
+
+def _infer_chunked_schema(records: List[Dict[str, Any]]) -> "pa.Schema":
+    """
+    Infer one Arrow schema for a long record list, a chunk at a time.
+
+    Only column types are inferred (pa.infer_type); no chunk is converted
+    to Arrow until _write_parquet writes it.
+
+    Args:
+        records: Property records
+
+    Returns:
+        Schema unified across all chunks (e.g. int and float columns become float)
+    """
+    schemas = []
+
+    for start in range(0, len(records), CHECKPOINT_CHUNK_ROWS):
+        chunk = records[start:start + CHECKPOINT_CHUNK_ROWS]
+        columns = dict.fromkeys(key for record in chunk for key in record)
+        schemas.append(pa.schema([
+            (column, pa.infer_type([record.get(column) for record in chunk]))
+            for column in columns
+        ]))
+
+    # promote_options needs pyarrow >= 14 (see requirements-optional.txt)
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def _write_parquet(records: List[Dict[str, Any]], table: Any, checkpoint_file: Path):
+    """
+    Write records to a Parquet file, in row-group sized chunks for long lists.
+
+    Args:
+        records: Property records
+        table: Arrow table of the records, or their schema if they are chunked
+        checkpoint_file: Output path
+    """
+    if isinstance(table, pa.Table):
+        pq.write_table(table, checkpoint_file, compression="zstd", use_dictionary=True)
+        return
+
+    with pq.ParquetWriter(checkpoint_file, table, compression="zstd", use_dictionary=True) as writer:
+        for start in range(0, len(records), CHECKPOINT_CHUNK_ROWS):
+            chunk = pa.Table.from_pylist(records[start:start + CHECKPOINT_CHUNK_ROWS], schema=table)
+            writer.write_table(chunk, row_group_size=CHECKPOINT_CHUNK_ROWS)
+
+
 def load_checkpoint(checkpoint_name: str, latest: bool = True) -> Optional[Any]:
     """
     Load pipeline checkpoint from disk.
@@ -101,24 +272,35 @@ def load_checkpoint(checkpoint_name: str, latest: bool = True) -> Optional[Any]:
     Returns:
         Loaded checkpoint data or None if not found
     """
-    logger = get_logger(__name__)
+    logger = _LOGGER
 
-    # Find matching checkpoint files
-    checkpoint_files = list(CHECKPOINT_DIR.glob(f"{checkpoint_name}_*.json"))
+    # Find matching checkpoint files in either format; a save falls back to JSON
+    # when Arrow cannot type the records, so the newest file may be either one
+    suffixes = (".parquet", ".json") if PYARROW_AVAILABLE else (".json",)
+    checkpoint_entries = _scan_checkpoints(f"{checkpoint_name}_", suffixes)
 
-    if not checkpoint_files:
+    if not checkpoint_entries:
         logger.warning(f"No checkpoint found for: {checkpoint_name}")
         return None
 
-    # Sort by modification time and get latest
+    # Pick the latest by modification time (one stat per entry), then by timestamp suffix
     if latest:
-        checkpoint_file = max(checkpoint_files, key=lambda p: p.stat().st_mtime)
+        checkpoint_entry = max(
+            checkpoint_entries, key=lambda entry: (entry.stat().st_mtime_ns, entry.name)
+        )
     else:
-        checkpoint_file = checkpoint_files[0]
+        checkpoint_entry = checkpoint_entries[0]
+
+    checkpoint_file = Path(checkpoint_entry.path)
 
     try:
-        with open(checkpoint_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if checkpoint_file.suffix == ".parquet":
+            data = _load_parquet_checkpoint(checkpoint_file)
+        elif ORJSON_AVAILABLE:
+            data = orjson.loads(checkpoint_file.read_bytes())
+        else:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         logger.info(f"Checkpoint loaded: {checkpoint_file}")
         return data
@@ -128,6 +310,51 @@ def load_checkpoint(checkpoint_name: str, latest: bool = True) -> Optional[Any]:
         return None
 
 
+def _scan_checkpoints(prefix: str, suffixes: tuple) -> List[os.DirEntry]:
+    """
+    List checkpoint files with a name prefix and suffix in a single directory scan.
+
+    Args:
+        prefix: File name prefix (empty for all checkpoints)
+        suffixes: Accepted file extensions
+
+    Returns:
+        Matching directory entries (hidden files are skipped, as with glob)
+    """
+    try:
+        with os.scandir(CHECKPOINT_DIR) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffixes)
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _load_parquet_checkpoint(checkpoint_file: Path) -> Any:
+    """
+    Load a Parquet checkpoint, including its sibling files for dict payloads.
+
+    Args:
+        checkpoint_file: Any one of the checkpoint's Parquet files
+
+    Returns:
+        Record list, or dict of record lists
+    """
+    stem, _, key = checkpoint_file.name[:-len(".parquet")].partition(".")
+
+    if not key:
+        return pq.read_table(checkpoint_file).to_pylist()
+
+    return {
+        path.name[:-len(".parquet")].partition(".")[2]: pq.read_table(path).to_pylist()
+        for path in sorted(checkpoint_file.parent.glob(f"{stem}.*.parquet"))
+    }
+
+
 def clear_checkpoints(checkpoint_name: Optional[str] = None) -> int:
     """
     Clear checkpoint files.
@@ -138,13 +365,13 @@ def clear_checkpoints(checkpoint_name: Optional[str] = None) -> int:
     Returns:
         Number of files deleted
     """
-    logger = get_logger(__name__)
+    logger = _LOGGER
 
-    # Determine pattern
-    pattern = f"{checkpoint_name}_*.json" if checkpoint_name else "*.json"
+    # Determine prefix
+    prefix = f"{checkpoint_name}_" if checkpoint_name else ""
 
     # Find and delete files
-    checkpoint_files = list(CHECKPOINT_DIR.glob(pattern))
+    checkpoint_files = [Path(entry.path) for entry in _scan_checkpoints(prefix, (".json", ".parquet"))]
     count = 0
 
     for file_path in checkpoint_files:
@@ -166,27 +393,28 @@ def generate_record_hash(record: Dict[str, Any], fields: List[str]) -> str:
     """
     Generate a unique hash for a record based on specific fields.
 
+    Uses BLAKE3 when installed, otherwise BLAKE2b. Both give 128-bit digests,
+    but not the same ones, so hashes are only comparable within one setup.
+
     Args:
         record: Property record dictionary
         fields: List of field names to include in hash
 
     Returns:
-        MD5 hash string
+        32-character hex hash string
     """
-    # Extract values for specified fields
-    values = []
-    for field in fields:
-        value = record.get(field, "")
-        # Normalize to string and lowercase
-        value_str = str(value).strip().lower() if value else ""
-        values.append(value_str)
+    hasher = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.blake2b(digest_size=16)
 
-    # Create concatenated string
-    combined = "|".join(values)
+    # Feed normalized field values (string, lowercase) separated by "|"
+    for position, field in enumerate(fields):
+        if position:
+            hasher.update(b"|")
 
-    # Generate MD5 hash
-    hash_obj = hashlib.md5(combined.encode('utf-8'))
-    return hash_obj.hexdigest()
+        value = record.get(field, "")
+        if value:
+            hasher.update(str(value).strip().lower().encode('utf-8'))
+
+    return hasher.hexdigest(16) if BLAKE3_AVAILABLE else hasher.hexdigest()
 
 
 def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
@@ -203,19 +431,23 @@ def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
     """
     value = data.get(key, default)
 
-    # Return default if value is None or empty string
-    if value is None or (isinstance(value, str) and not value.strip()):
+    # Return default if value is None or empty string (isspace avoids a stripped copy)
+    if value is None or (isinstance(value, str) and (not value or value.isspace())):
         return default
 
     return value
 
 
+# Currency symbols, thousands separators and spaces removed by parse_currency
+_CURRENCY_STRIP = str.maketrans("", "", "$,€£¥ ")
+
+
 def parse_currency(value: str) -> Optional[float]:
     """
     Parse currency string to float.
 
     Args:
-        value: Currency string (e.g., "$1,234.56", "1234.56")
+        value: Currency string (e.g., "$1,234.56", "€1 234.56", "1234.56")
 
     Returns:
         Float value or None if parsing fails
@@ -223,14 +455,68 @@ def parse_currency(value: str) -> Optional[float]:
     if not value or not isinstance(value, str):
         return None
 
+    return _parse_currency_cached(value)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_currency_cached(value: str) -> Optional[float]:
+    """
+    Parse a non-empty currency string, memoized for repeated values.
+
+    Args:
+        value: Currency string
+
+    Returns:
+        Float value or None if parsing fails
+    """
     try:
-        # Remove currency symbols and commas
-        cleaned = value.strip().replace("$", "").replace(",", "")
+        # Remove currency symbols and commas in a single pass
+        cleaned = value.strip().translate(_CURRENCY_STRIP)
         return float(cleaned)
-    except (ValueError, AttributeError):
+    except ValueError:
         return None
 
 
+# Default formats tried by parse_date, in order
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+    "%B %d, %Y",
+    "%b %d, %Y",
+)
+
+
+def _date_format_for_shape(date_str: str) -> Optional[str]:
+    """
+    Guess the default date format from separator positions.
+
+    Only formats that are the first default to match their shape are
+    returned, so the result is the same as trying the defaults in order.
+
+    Args:
+        date_str: Stripped date string
+
+    Returns:
+        Format string, or None if the shape is not recognized
+    """
+    if len(date_str) != 10:
+        return None
+
+    if date_str[4] == date_str[7] == "-":
+        return "%Y-%m-%d"
+    if date_str[2] == date_str[5] == "/":
+        return "%m/%d/%Y"
+    if date_str[2] == date_str[5] == "-":
+        return "%m-%d-%Y"
+    if date_str[4] == date_str[7] == "/":
+        return "%Y/%m/%d"
+
+    return None
+
+
 def parse_date(date_str: str, formats: Optional[List[str]] = None) -> Optional[str]:
     """
     Parse date string to ISO format (YYYY-MM-DD).
@@ -245,21 +531,57 @@ def parse_date(date_str: str, formats: Optional[List[str]] = None) -> Optional[s
     if not date_str or not isinstance(date_str, str):
         return None
 
-    # Default formats to try
     if formats is None:
-        formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%m-%d-%Y",
-            "%d/%m/%Y",
-            "%Y/%m/%d",
-            "%B %d, %Y",
-            "%b %d, %Y",
-        ]
+        return _parse_date_cached(date_str)
+
+    return _parse_date_formats(date_str.strip(), formats)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """
+    Parse a date string with the default formats, memoized for repeated values.
 
+    Args:
+        date_str: Non-empty date string
+
+    Returns:
+        ISO formatted date string or None if parsing fails
+    """
+    date_str = date_str.strip()
+
+    # Fast path: common numeric shapes go straight to their format
+    guessed = _date_format_for_shape(date_str)
+    if guessed:
+        try:
+            return datetime.strptime(date_str, guessed).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
+    return _parse_date_formats(date_str, _DATE_FORMATS, skip=guessed)
+
+
+def _parse_date_formats(
+    date_str: str,
+    formats: Sequence[str],
+    skip: Optional[str] = None
+) -> Optional[str]:
+    """
+    Try each format in order and return the first match in ISO format.
+
+    Args:
+        date_str: Stripped date string
+        formats: Datetime formats to try
+        skip: Format already tried, if any
+
+    Returns:
+        ISO formatted date string or None if no format matches
+    """
     for fmt in formats:
+        if fmt == skip:
+            continue
         try:
-            dt = datetime.strptime(date_str.strip(), fmt)
+            dt = datetime.strptime(date_str, fmt)
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             continue
@@ -303,16 +625,31 @@ def validate_dict_structure(data: Dict[str, Any], required_keys: List[str]) -> b
 # Progress Tracking
 # =======================
 
+# Minimum seconds between progress bar redraws (~30 Hz)
+_PROGRESS_INTERVAL = 1 / 30
+_last_progress_update = 0.0
+
+
 def print_progress(current: int, total: int, prefix: str = "", bar_length: int = 50):
     """
     Print a progress bar to console.
 
+    Redraws are throttled to about 30 per second; the final update is
+    always printed.
+
     Args:
         current: Current progress count
         total: Total count
         prefix: Prefix string to display
         bar_length: Length of the progress bar in characters
     """
+    global _last_progress_update
+
+    now = time.monotonic()
+    if current < total and now - _last_progress_update < _PROGRESS_INTERVAL:
+        return
+    _last_progress_update = now
+
     if total == 0:
         percent = 100.0
     else:
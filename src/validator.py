@@ -5,16 +5,104 @@ This module validates property records against required fields,
 data types, and patterns as defined in the requirements.
 """
 
+import functools
+import logging
+import os
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
+
+import numpy as np
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 from config.settings import (
     REQUIRED_FIELDS,
     FIELD_TYPES,
     VALIDATION_PATTERNS,
+    VALIDATION_REGEX_ENGINE,
 )
 from src.utils import get_logger
 
+# Placeholder for absent fields (distinct from None and NaN)
+_MISSING = object()
+
+# Records per worker process below which parallel validation is not worth the overhead
+PARALLEL_SHARD_MIN = 5000
+
+# Validation error codes and their message templates
+ERR_MISSING = 1
+ERR_EMPTY = 2
+ERR_TYPE = 3
+ERR_PATTERN = 4
+
+ERROR_MESSAGES = {
+    ERR_MISSING: "Missing required field: {field}",
+    ERR_EMPTY: "Required field is empty: {field}",
+    ERR_TYPE: "Field '{field}' has invalid type: expected {extra[0]}, got {extra[1]}",
+    ERR_PATTERN: "Field '{field}' does not match required pattern: {extra}",
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def format_error(code: int, field: str, extra: Any = None) -> str:
+    """
+    Format a validation error message.
+
+    Messages are cached, so records failing the same way share one string.
+
+    Args:
+        code: Error code (ERR_MISSING, ERR_EMPTY, ERR_TYPE or ERR_PATTERN)
+        field: Field name
+        extra: (expected_type, actual_type) for ERR_TYPE, the offending value for ERR_PATTERN
+
+    Returns:
+        Error message
+    """
+    return ERROR_MESSAGES[code].format(field=field, extra=extra)
+
+
+# =======================
+# Hand-rolled Pattern Checks
+# =======================
+# Equivalent to the anchored, ASCII-compiled default patterns in VALIDATION_PATTERNS;
+# used in place of the regex only when the configured pattern string is one of these
+
+_PARCEL_ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-"
+
+
+def _is_zip_code(value: str) -> bool:
+    """Check a 5-digit or ZIP+4 code made of ASCII digits."""
+    length = len(value)
+    if length == 5:
+        return value.isdigit() and value.isascii()
+    # With a hyphen at index 5, removing the first hyphen leaves only digits iff it was the only one
+    return length == 10 and value[5] == "-" and value.isascii() and value.replace("-", "", 1).isdigit()
+
+
+def _is_state_code(value: str) -> bool:
+    """Check a two-letter uppercase ASCII state code."""
+    return len(value) == 2 and value.isascii() and value.isalpha() and value.isupper()
+
+
+def _is_parcel_id(value: str) -> bool:
+    """Check a non-empty run of uppercase ASCII letters, digits and hyphens."""
+    # Stripping every allowed character from both ends leaves nothing only if all are allowed
+    return bool(value) and not value.strip(_PARCEL_ID_CHARS)
+
+
+_PATTERN_CHECKS = {
+    r"^\d{5}(-\d{4})?$": _is_zip_code,
+    r"^[A-Z]{2}$": _is_state_code,
+    r"^[A-Z0-9\-]+$": _is_parcel_id,
+}
+
 
 class PropertyValidator:
     """Validator for property records."""
@@ -27,11 +115,72 @@ class PropertyValidator:
         self.patterns = VALIDATION_PATTERNS
 
         # Compiled regex patterns for efficiency
+        self.use_re2 = VALIDATION_REGEX_ENGINE == "re2" and RE2_AVAILABLE
         self.compiled_patterns = {
-            field: re.compile(pattern)
+            field: self._compile_pattern(pattern)
             for field, pattern in self.patterns.items()
         }
 
+        # String checks standing in for known simple patterns (None: use the regex)
+        self._pattern_checks = {
+            field: _PATTERN_CHECKS.get(pattern)
+            for field, pattern in self.patterns.items()
+        }
+
+        # Required-field membership for is_required_field (REQUIRED_FIELDS is a list)
+        self._required_set = frozenset(self.required_fields)
+
+        # (field, expected type or tuple of types) pairs; isinstance accepts either form
+        self._type_checks = tuple(self.field_types.items())
+
+        # Pattern fields in declaration order, so errors are reported in a stable order
+        self._pattern_fields = tuple(self.compiled_patterns)
+
+        # Pattern results per (field, value); cities, states and ZIP codes repeat a lot
+        self._match_cache = functools.lru_cache(maxsize=131072)(self._match_uncached)
+
+        # Last (value, matched) per pattern field, reset per batch
+        self._last_match = {}
+
+    def _match_uncached(self, field: str, value_str: str) -> bool:
+        """
+        Match a stripped value against a field's pattern.
+
+        Args:
+            field: Field name with a validation pattern
+            value_str: Stripped string value
+
+        Returns:
+            True if the value matches the pattern
+        """
+        check = self._pattern_checks[field]
+        if check is not None:
+            return check(value_str)
+
+        return self.compiled_patterns[field].match(value_str) is not None
+
+    def _compile_pattern(self, pattern: str) -> Any:
+        """
+        Compile a validation pattern with the configured regex engine.
+
+        Patterns RE2 cannot compile (e.g. backreferences) fall back to re.
+
+        Args:
+            pattern: Regex pattern string
+
+        Returns:
+            Compiled pattern object with a match() method
+        """
+        if self.use_re2:
+            try:
+                return re2.compile(pattern)
+            except Exception as e:
+                self.logger.debug(f"RE2 cannot compile {pattern!r}, using re: {e}")
+
+        # Property codes are ASCII: match ASCII classes only (as RE2 does) and
+        # anchor the whole value, so \d never matches other scripts' digits
+        return re.compile(rf"\A(?:{pattern})\Z", re.ASCII)
+
     def validate_record(
         self,
         record: Dict[str, Any],
@@ -47,16 +196,19 @@ class PropertyValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        # Clean records (the common case) pass every check with no error lists to build
+        if self._is_valid(record, strict=True):
+            return True, []
+
         errors = []
 
         # Validate required fields
         required_errors = self._validate_required_fields(record)
         errors.extend(required_errors)
 
-        # If strict mode or required fields missing, stop here
-        if strict or required_errors:
-            if required_errors:
-                return False, errors
+        # Required fields missing: stop here, before any per-field type/pattern work
+        if required_errors:
+            return False, errors
 
         # Validate field types
         type_errors = self._validate_field_types(record)
@@ -71,6 +223,81 @@ class PropertyValidator:
 
         return is_valid, errors
 
+    def _required_error(self, field: str, value: Any) -> Optional[str]:
+        """
+        Check a required field's value.
+
+        This and _type_error/_pattern_error hold the validation rules; the
+        record, column and early-exit paths all go through them.
+
+        Args:
+            field: Required field name
+            value: Field value (_MISSING if the field is absent)
+
+        Returns:
+            Error message, or None if the value passes
+        """
+        if value is _MISSING:
+            return format_error(ERR_MISSING, field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return format_error(ERR_EMPTY, field)
+        return None
+
+    def _type_error(self, field: str, value: Any) -> Optional[str]:
+        """
+        Check a field value's type.
+
+        Args:
+            field: Field name with an expected type
+            value: Field value (_MISSING if the field is absent)
+
+        Returns:
+            Error message, or None if the value passes
+        """
+        # Missing fields (handled by required fields check) and None values (optional fields)
+        if value is None or value is _MISSING:
+            return None
+
+        expected_type = self.field_types[field]
+        if not isinstance(value, expected_type):
+            return format_error(ERR_TYPE, field, (expected_type, type(value)))
+        return None
+
+    def _pattern_error(self, field: str, value: Any) -> Optional[str]:
+        """
+        Check a field value against the field's pattern.
+
+        Args:
+            field: Field name with a validation pattern
+            value: Field value (_MISSING if the field is absent)
+
+        Returns:
+            Error message, or None if the value passes
+        """
+        # Skip missing fields and None values
+        if value is None or value is _MISSING:
+            return None
+
+        # Convert to string if needed, stripping once
+        value_str = str(value).strip()
+
+        # Skip empty strings
+        if not value_str and isinstance(value, str):
+            return None
+
+        # Consecutive records often repeat a value (e.g. state, or sorted cities):
+        # reuse the last result for this field before going to the match cache
+        last = self._last_match.get(field)
+        if last is not None and last[0] is value_str:
+            matched = last[1]
+        else:
+            matched = self._match_cache(field, value_str)
+            self._last_match[field] = (value_str, matched)
+
+        if not matched:
+            return format_error(ERR_PATTERN, field, value_str)
+        return None
+
     def _validate_required_fields(self, record: Dict[str, Any]) -> List[str]:
         """
         Validate that all required fields are present and non-empty.
@@ -81,15 +308,8 @@ class PropertyValidator:
         Returns:
             List of error messages
         """
-        errors = []
-
-        for field in self.required_fields:
-            if field not in record:
-                errors.append(f"Missing required field: {field}")
-            elif record[field] is None or (isinstance(record[field], str) and not record[field].strip()):
-                errors.append(f"Required field is empty: {field}")
-
-        return errors
+        errors = (self._required_error(field, record.get(field, _MISSING)) for field in self.required_fields)
+        return [error for error in errors if error]
 
     def _validate_field_types(self, record: Dict[str, Any]) -> List[str]:
         """
@@ -101,33 +321,8 @@ class PropertyValidator:
         Returns:
             List of error messages
         """
-        errors = []
-
-        for field, expected_type in self.field_types.items():
-            if field not in record:
-                continue  # Skip missing fields (handled by required fields check)
-
-            value = record[field]
-
-            # Skip None values (optional fields)
-            if value is None:
-                continue
-
-            # Check if value matches expected type(s)
-            if isinstance(expected_type, tuple):
-                # Multiple allowed types
-                if not isinstance(value, expected_type):
-                    errors.append(
-                        f"Field '{field}' has invalid type: expected {expected_type}, got {type(value)}"
-                    )
-            else:
-                # Single expected type
-                if not isinstance(value, expected_type):
-                    errors.append(
-                        f"Field '{field}' has invalid type: expected {expected_type}, got {type(value)}"
-                    )
-
-        return errors
+        errors = (self._type_error(field, record.get(field, _MISSING)) for field, _ in self._type_checks)
+        return [error for error in errors if error]
 
     def _validate_patterns(self, record: Dict[str, Any]) -> List[str]:
         """
@@ -139,46 +334,61 @@ class PropertyValidator:
         Returns:
             List of error messages
         """
-        errors = []
+        errors = (self._pattern_error(field, record.get(field, _MISSING)) for field in self._pattern_fields)
+        return [error for error in errors if error]
 
-        for field, pattern in self.compiled_patterns.items():
-            if field not in record:
-                continue  # Skip missing fields
+    def validate_batch(
+        self,
+        records: List[Dict[str, Any]],
+        strict: bool = False,
+        stop_on_error: bool = False,
+        workers: Optional[int] = 1
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, Dict[str, Any], List[str]]]]:
+        """
+        Validate a batch of property records.
 
-            value = record[field]
+        Args:
+            records: List of property records
+            strict: If True, use strict validation
+            stop_on_error: If True, stop validation on first error
+            workers: Number of worker processes; None picks one per PARALLEL_SHARD_MIN
+                records, up to the CPU count (see validate_batch_parallel). Ignored
+                with stop_on_error.
 
-            # Skip None or empty values
-            if value is None or (isinstance(value, str) and not value.strip()):
-                continue
+        Returns:
+            Tuple of (valid_records, invalid_records_with_errors)
+            where invalid_records_with_errors is a list of (index, record, errors)
+        """
+        if not stop_on_error and workers != 1:
+            return self.validate_batch_parallel(records, strict=strict, workers=workers)
 
-            # Convert to string if needed
-            value_str = str(value).strip()
+        self._last_match.clear()
 
-            # Validate against pattern
-            if not pattern.match(value_str):
-                errors.append(
-                    f"Field '{field}' does not match required pattern: {value_str}"
-                )
+        if stop_on_error:
+            valid_records, invalid_records = self._validate_until_error(records, strict)
+        else:
+            valid_records, invalid_records = self._validate_batch_soa(records, strict)
 
-        return errors
+        self.logger.info(
+            f"Validated {len(records)} records: {len(valid_records)} valid, {len(invalid_records)} invalid"
+        )
 
-    def validate_batch(
+        return valid_records, invalid_records
+
+    def _validate_until_error(
         self,
         records: List[Dict[str, Any]],
-        strict: bool = False,
-        stop_on_error: bool = False
+        strict: bool = False
     ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, Dict[str, Any], List[str]]]]:
         """
-        Validate a batch of property records.
+        Validate records one at a time, stopping at the first invalid record.
 
         Args:
             records: List of property records
             strict: If True, use strict validation
-            stop_on_error: If True, stop validation on first error
 
         Returns:
             Tuple of (valid_records, invalid_records_with_errors)
-            where invalid_records_with_errors is a list of (index, record, errors)
         """
         valid_records = []
         invalid_records = []
@@ -190,17 +400,149 @@ class PropertyValidator:
                 valid_records.append(record)
             else:
                 invalid_records.append((idx, record, errors))
+                self.logger.warning(f"Stopping validation at record {idx} due to errors")
+                break
+
+        return valid_records, invalid_records
 
-                if stop_on_error:
-                    self.logger.warning(f"Stopping validation at record {idx} due to errors")
-                    break
+    def _validate_batch_soa(
+        self,
+        records: List[Dict[str, Any]],
+        strict: bool = False
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, Dict[str, Any], List[str]]]]:
+        """
+        Validate a batch column by column (structure of arrays).
+
+        Each checked field is read out of every record once and checked as a
+        whole column; error messages are only built for the rows that fail.
+        Errors and their order match validate_record.
+
+        Args:
+            records: List of property records
+            strict: If True, use strict validation
+
+        Returns:
+            Tuple of (valid_records, invalid_records_with_errors)
+            where invalid_records_with_errors is a list of (index, record, errors)
+        """
+        # One column per checked field, shared by the required, type and pattern checks
+        columns = {}
+
+        def column(field):
+            if field not in columns:
+                columns[field] = [record.get(field, _MISSING) for record in records]
+            return columns[field]
+
+        required_errors = defaultdict(list)
+        for field in self.required_fields:
+            self._validate_column(self._required_error, field, column(field), required_errors)
+
+        # Type and pattern errors only decide validity in strict mode
+        other_errors = defaultdict(list)
+        if strict:
+            for field, _ in self._type_checks:
+                self._validate_column(self._type_error, field, column(field), other_errors)
+            for field in self._pattern_fields:
+                self._validate_column(self._pattern_error, field, column(field), other_errors)
+
+        invalid_records = []
+
+        for idx in sorted(required_errors.keys() | other_errors.keys()):
+            # validate_record stops at required-field errors
+            errors = required_errors.get(idx) or other_errors[idx]
+            invalid_records.append((idx, records[idx], errors))
+
+        return self._drop_invalid(records, invalid_records), invalid_records
+
+    def _validate_column(
+        self,
+        rule: Callable[[str, Any], Optional[str]],
+        field: str,
+        column: List[Any],
+        errors: Dict[int, List[str]]
+    ):
+        """
+        Apply one field rule over a column of values.
+
+        Args:
+            rule: _required_error, _type_error or _pattern_error
+            field: Field name
+            column: Field values, one per record (_MISSING for absent fields)
+            errors: Dictionary of per-record errors to append to
+        """
+        for idx, value in enumerate(column):
+            error = rule(field, value)
+            if error:
+                errors[idx].append(error)
+
+    def validate_batch_parallel(
+        self,
+        records: List[Dict[str, Any]],
+        strict: bool = False,
+        workers: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, Dict[str, Any], List[str]]]]:
+        """
+        Validate a batch of property records in shards across worker processes.
+
+        Workers only send back the indices and errors of invalid records, so the
+        returned lists hold the caller's own record objects, as in validate_batch.
+
+        Args:
+            records: List of property records
+            strict: If True, use strict validation
+            workers: Number of worker processes (default: one per
+                PARALLEL_SHARD_MIN records, up to the CPU count)
+
+        Returns:
+            Tuple of (valid_records, invalid_records_with_errors)
+            where invalid_records_with_errors is a list of (index, record, errors)
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, len(records) // PARALLEL_SHARD_MIN)
+
+        if workers <= 1:
+            return self.validate_batch(records, strict=strict, workers=1)
+
+        shard_size = -(-len(records) // workers)
+        shards = [
+            (start, records[start:start + shard_size], strict)
+            for start in range(0, len(records), shard_size)
+        ]
+
+        invalid_records = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for shard_invalid in executor.map(_validate_shard, shards):
+                invalid_records.extend((idx, records[idx], errors) for idx, errors in shard_invalid)
+
+        valid_records = self._drop_invalid(records, invalid_records)
 
         self.logger.info(
-            f"Validated {len(records)} records: {len(valid_records)} valid, {len(invalid_records)} invalid"
+            f"Validated {len(records)} records in {len(shards)} shards: "
+            f"{len(valid_records)} valid, {len(invalid_records)} invalid"
         )
 
         return valid_records, invalid_records
 
+    def _drop_invalid(
+        self,
+        records: List[Dict[str, Any]],
+        invalid_records: List[Tuple[int, Dict[str, Any], List[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the records not listed as invalid, in their original order.
+
+        Args:
+            records: List of property records
+            invalid_records: List of (index, record, errors)
+
+        Returns:
+            List of valid records
+        """
+        invalid = np.zeros(len(records), dtype=bool)
+        invalid[[idx for idx, _, _ in invalid_records]] = True
+
+        return list(compress(records, ~invalid))
+
     def get_validation_summary(
         self,
         invalid_records: List[Tuple[int, Dict[str, Any], List[str]]]
@@ -221,23 +563,71 @@ class PropertyValidator:
                 "most_common_errors": [],
             }
 
-        # Count error types
-        error_counts = {}
-        for _, _, errors in invalid_records:
-            for error in errors:
-                # Extract error type (first part before ':')
-                error_type = error.split(":")[0].strip()
-                error_counts[error_type] = error_counts.get(error_type, 0) + 1
-
-        # Sort errors by frequency
-        sorted_errors = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
+        # Count error types (first part before ':')
+        error_counts = Counter(
+            error.partition(":")[0].strip()
+            for _, _, errors in invalid_records
+            for error in errors
+        )
 
         return {
             "total_invalid": len(invalid_records),
-            "error_counts": error_counts,
-            "most_common_errors": sorted_errors[:5],  # Top 5 errors
+            "error_counts": dict(error_counts),
+            "most_common_errors": error_counts.most_common(5),  # Top 5 errors
         }
 
+    def iter_valid_records(
+        self,
+        records: Iterable[Dict[str, Any]],
+        strict: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield only the valid records, lazily.
+
+        Each record is checked with an early exit at its first failing field;
+        no error messages are built and nothing is kept for invalid records.
+
+        Args:
+            records: Iterable of property records
+            strict: If True, use strict validation
+
+        Yields:
+            Valid records, in input order
+        """
+        is_valid = self._is_valid
+
+        for record in records:
+            if is_valid(record, strict):
+                yield record
+
+    def _is_valid(self, record: Dict[str, Any], strict: bool = False) -> bool:
+        """
+        Check a record the way validate_record does, stopping at the first error.
+
+        Args:
+            record: Property record
+            strict: If True, also check field types and patterns
+
+        Returns:
+            True if validate_record would report no errors
+        """
+        for field in self.required_fields:
+            if self._required_error(field, record.get(field, _MISSING)):
+                return False
+
+        if not strict:
+            return True
+
+        for field, _ in self._type_checks:
+            if self._type_error(field, record.get(field, _MISSING)):
+                return False
+
+        for field in self._pattern_fields:
+            if self._pattern_error(field, record.get(field, _MISSING)):
+                return False
+
+        return True
+
     def filter_valid_records(
         self,
         records: List[Dict[str, Any]],
@@ -253,14 +643,21 @@ class PropertyValidator:
         Returns:
             List of valid records
         """
-        valid_records, invalid_records = self.validate_batch(records, strict=strict)
+        valid_records = list(self.iter_valid_records(records, strict=strict))
+        filtered = len(records) - len(valid_records)
 
-        if invalid_records:
-            self.logger.warning(f"Filtered out {len(invalid_records)} invalid records")
+        if filtered:
+            self.logger.warning(f"Filtered out {filtered} invalid records")
 
-            # Log first few errors for debugging
-            for idx, record, errors in invalid_records[:3]:
-                self.logger.debug(f"Record {idx} errors: {errors}")
+            # Log first few errors for debugging (re-validating only those records)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                invalid = (
+                    (idx, record) for idx, record in enumerate(records)
+                    if not self._is_valid(record, strict)
+                )
+                for idx, record in islice(invalid, 3):
+                    _, errors = self.validate_record(record, strict=strict)
+                    self.logger.debug(f"Record {idx} errors: {errors}")
 
         return valid_records
 
@@ -289,26 +686,17 @@ class PropertyValidator:
         if check_type and field_name in self.field_types:
             expected_type = self.field_types[field_name]
 
-            if value is not None:
-                if isinstance(expected_type, tuple):
-                    if not isinstance(value, expected_type):
-                        errors.append(
-                            f"Invalid type: expected {expected_type}, got {type(value)}"
-                        )
-                else:
-                    if not isinstance(value, expected_type):
-                        errors.append(
-                            f"Invalid type: expected {expected_type}, got {type(value)}"
-                        )
+            if value is not None and not isinstance(value, expected_type):
+                errors.append(
+                    f"Invalid type: expected {expected_type}, got {type(value)}"
+                )
 
         # Check pattern
-        if check_pattern and field_name in self.compiled_patterns:
-            if value is not None and str(value).strip():
-                pattern = self.compiled_patterns[field_name]
-                value_str = str(value).strip()
+        if check_pattern and field_name in self.compiled_patterns and value is not None:
+            value_str = str(value).strip()
 
-                if not pattern.match(value_str):
-                    errors.append(f"Does not match required pattern: {value_str}")
+            if value_str and not self._match_cache(field_name, value_str):
+                errors.append(f"Does not match required pattern: {value_str}")
 
         is_valid = len(errors) == 0
         return is_valid, errors
@@ -323,7 +711,7 @@ class PropertyValidator:
         Returns:
             True if field is required, False otherwise
         """
-        return field_name in self.required_fields
+        return field_name in self._required_set
 
     def get_field_type(self, field_name: str) -> Optional[Any]:
         """
@@ -348,3 +736,49 @@ class PropertyValidator:
             Regex pattern string or None if not defined
         """
         return self.patterns.get(field_name)
+
+    def get_compiled_pattern(self, field_name: str) -> Optional[Any]:
+        """
+        Get the compiled validation pattern for a field.
+
+        Patterns are compiled once in __init__ (fully anchored), so callers can
+        match with the returned object directly instead of re-resolving the string.
+
+        Args:
+            field_name: Name of the field
+
+        Returns:
+            Compiled pattern or None if not defined
+        """
+        return self.compiled_patterns.get(field_name)
+
+
+# Validator reused by every shard a worker process handles
+_shard_validator = None
+
+
+def _validate_shard(
+    shard: Tuple[int, List[Dict[str, Any]], bool]
+) -> List[Tuple[int, List[str]]]:
+    """
+    Validate one shard of records in a worker process.
+
+    Args:
+        shard: Tuple of (offset of the shard in the batch, records, strict)
+
+    Returns:
+        List of (batch index, errors) for the invalid records
+    """
+    global _shard_validator
+
+    if _shard_validator is None:
+        _shard_validator = PropertyValidator()
+
+    offset, records, strict = shard
+
+    _, invalid_records = _shard_validator._validate_batch_soa(records, strict)
+
+    return [
+        (offset + idx, errors)
+        for idx, _, errors in invalid_records
+    ]
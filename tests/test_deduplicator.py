@@ -244,3 +244,20 @@ class TestDeduplicateAndMerge:
         assert stats["total_groups"] >= 0
         assert "total_duplicates" in stats
         assert "avg_group_size" in stats
+
+    def test_across_sources_skips_same_source_pairs(self, deduplicator):
+        """Test the cross-source pass only compares records from different sources."""
+        records = [
+            {"owner_name": "John Smith", "property_address": "1 Main St", "source": "Wake County API"},
+            {"owner_name": "John Smith", "property_address": "1 Main St", "source": "Wake County API"},
+            {"owner_name": "John Smith", "property_address": "1 Main St", "source": "Orange County Scraper"},
+        ]
+
+        deduplicated, duplicates, groups = deduplicator.deduplicate_across_sources(
+            records, return_groups=True
+        )
+
+        # The Wake pair is left to the per-source pass; each Wake record pairs with Orange
+        assert len(groups) == 1
+        assert [rec["source"] for rec in groups[0]] == ["Wake County API", "Orange County Scraper"]
+        assert len(deduplicated) == 2
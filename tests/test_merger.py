@@ -0,0 +1,118 @@
+"""
+Unit tests for the PropertyMerger module.
+
+Tests cross-source merging according to FR-5.
+"""
+
+import pytest
+from src.merger import PropertyMerger
+
+
+@pytest.fixture
+def merger():
+    """Create a PropertyMerger instance for testing."""
+    return PropertyMerger()
+
+
+def make_record(parcel_id, source, extracted_at="2025-01-01T00:00:00", **fields):
+    """Build a minimal property record."""
+    return {
+        "parcel_id": parcel_id,
+        "source": source,
+        "source_url": f"https://example.com/{source.split()[0].lower()}/{parcel_id}",
+        "extracted_at": extracted_at,
+        **fields,
+    }
+
+
+class TestMergeSources:
+    """Test merging of Wake County and Orange County records."""
+
+    def test_single_match_merged(self, merger):
+        """Test one record per source is merged into one."""
+        wake = [make_record("P1", "Wake County API", owner_name="John Smith")]
+        orange = [make_record("p1 ", "Orange County Scraper", property_address="1 Main St")]
+
+        merged, stats = merger.merge_sources(wake, orange)
+
+        assert len(merged) == 1
+        assert stats["merged"] == 1
+        assert merged[0]["is_cross_source_merged"] is True
+        assert merged[0]["owner_name"] == "John Smith"
+        assert merged[0]["property_address"] == "1 Main St"
+        assert merged[0]["source"] == "Wake County API + Orange County Scraper"
+
+    def test_unmatched_records_pass_through(self, merger):
+        """Test records without a counterpart are kept as-is."""
+        wake = [make_record("P1", "Wake County API")]
+        orange = [make_record("P2", "Orange County Scraper")]
+
+        merged, stats = merger.merge_sources(wake, orange)
+
+        assert len(merged) == 2
+        assert stats["wake_only"] == 1
+        assert stats["orange_only"] == 1
+        assert stats["merged"] == 0
+
+    def test_duplicate_keys_paired_not_cross_joined(self, merger):
+        """Test duplicate keys are paired one-to-one instead of N x M."""
+        wake = [
+            make_record("P1", "Wake County API", "2025-01-02T00:00:00"),
+            make_record("P1", "Wake County API", "2025-01-01T00:00:00"),
+            make_record("P1", "Wake County API", "2025-01-03T00:00:00"),
+        ]
+        orange = [
+            make_record("P1", "Orange County Scraper", "2025-01-01T00:00:00"),
+            make_record("P1", "Orange County Scraper", "2025-01-02T00:00:00"),
+        ]
+
+        merged, stats = merger.merge_sources(wake, orange)
+
+        assert len(merged) == 3
+        assert stats["merged"] == 2
+        assert stats["wake_only"] == 1
+        assert stats["total"] == 3
+        # Records are paired in extraction order
+        assert [rec["extracted_at"] for rec in merged] == [
+            "2025-01-01T00:00:00",
+            "2025-01-02T00:00:00",
+            "2025-01-03T00:00:00",
+        ]
+
+    def test_vectorized_merge_matches(self, merger):
+        """Test the pandas merge produces the same pairing and values."""
+        wake = [
+            make_record("P1", "Wake County API", owner_name="John Smith", year_built=1990),
+            make_record("P2", "Wake County API", owner_name="Jane Doe"),
+        ]
+        orange = [
+            make_record("p1", "Orange County Scraper", owner_name="John A. Smith", year_built=None),
+            make_record("P3", "Orange County Scraper", owner_name="Bob Lee"),
+        ]
+
+        expected, expected_stats = merger.merge_sources(wake, orange)
+        merged, stats = merger.merge_sources_df(wake, orange)
+
+        assert stats == expected_stats
+        by_source = {rec["source"]: rec for rec in merged}
+        for rec in expected:
+            assert by_source[rec["source"]] == rec
+
+    def test_empty_source_passes_through(self, merger):
+        """Test merging with one empty source returns the other unchanged."""
+        wake = [make_record("P1", "Wake County API"), make_record("P2", "Wake County API")]
+
+        merged, stats = merger.merge_sources(wake, [])
+
+        assert merged == wake
+        assert stats == {"wake_only": 2, "orange_only": 0, "merged": 0, "total": 2}
+
+    def test_records_without_key_kept(self, merger):
+        """Test records missing the merge key are passed through."""
+        wake = [make_record("P1", "Wake County API"), make_record("", "Wake County API")]
+        orange = [make_record("P1", "Orange County Scraper"), make_record(None, "Orange County Scraper")]
+
+        merged, stats = merger.merge_sources(wake, orange)
+
+        assert len(merged) == 3
+        assert stats == {"wake_only": 1, "orange_only": 1, "merged": 1, "total": 3}
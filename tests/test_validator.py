@@ -135,6 +135,12 @@ class TestPatternValidation:
         assert is_valid is False
         assert len(errors) > 0
 
+    def test_non_ascii_zip_code(self, validator):
+        """Test ZIP code digits must be ASCII."""
+        is_valid, errors = validator.validate_field("zip_code", "２７６０１", check_pattern=True)
+
+        assert is_valid is False
+
     def test_valid_state_code(self, validator):
         """Test valid state code pattern."""
         is_valid, errors = validator.validate_field("state", "NC", check_pattern=True)
@@ -161,6 +167,16 @@ class TestPatternValidation:
 
         assert is_valid is False
 
+    @pytest.mark.parametrize("value", [
+        "27601", "27601-1234", "2760", "27601-", "27601 1234", "２７６０１", "27601-12345",
+        "NC", "nc", "N", "NCA", "Ｎ C", "ÀB",
+        "ABC-123", "-", "abc-123", "A_1", "ABC 123", "ＡBC",
+    ])
+    def test_string_checks_match_regex(self, validator, value):
+        """Test the hand-rolled checks agree with the compiled patterns."""
+        for field, check in validator._pattern_checks.items():
+            assert check(value) == (validator.compiled_patterns[field].match(value) is not None)
+
 
 class TestBatchValidation:
     """Test batch validation."""
@@ -204,6 +220,51 @@ class TestBatchValidation:
         assert valid[0]["owner_name"] == "John Smith"
 
 
+class TestBatchValidationPaths:
+    """Test the sharded and lazy batch validation paths."""
+
+    @pytest.fixture
+    def records(self):
+        """Records covering missing, empty, mistyped and malformed fields."""
+        base = {"owner_name": "John Smith", "property_address": "123 Main St", "source": "Test", "extracted_at": "2025-01-01"}
+        return [
+            base,
+            {**base, "owner_name": "   "},
+            {**base, "zip_code": "27601", "state": "NC", "assessed_value": 250000},
+            {**base, "zip_code": "ABCDE"},
+            {**base, "sale_price": "300000"},
+            {**base, "assessed_value": True, "parcel_id": None},
+            {"owner_name": "Jane Doe", "source": "Test"},
+            {**base, "owner_name": float("nan")},
+        ]
+
+    @pytest.mark.parametrize("strict", [False, True])
+    def test_parallel_matches_validate_batch(self, validator, records, strict):
+        """Test sharded validation across processes matches per-record validation."""
+        expected = validator.validate_batch(records, strict=strict)
+
+        valid, invalid = validator.validate_batch_parallel(records, strict=strict, workers=2)
+
+        assert (valid, invalid) == expected
+        assert all(result is record for result, record in zip(valid, expected[0]))
+
+    def test_validate_batch_workers(self, validator, records):
+        """Test validate_batch shards across processes when given workers."""
+        expected = validator.validate_batch(records, strict=True)
+
+        assert validator.validate_batch(records, strict=True, workers=2) == expected
+        # Too few records for PARALLEL_SHARD_MIN: runs in-process
+        assert validator.validate_batch(records, strict=True, workers=None) == expected
+
+    @pytest.mark.parametrize("strict", [False, True])
+    def test_iter_valid_records_matches_validate_batch(self, validator, records, strict):
+        """Test the lazy filter yields exactly the records validate_batch accepts."""
+        expected, _ = validator.validate_batch(records, strict=strict)
+
+        assert list(validator.iter_valid_records(iter(records), strict=strict)) == expected
+        assert validator.filter_valid_records(records, strict=strict) == expected
+
+
 class TestValidationSummary:
     """Test validation summary statistics."""
 
@@ -253,3 +314,11 @@ class TestHelperMethods:
 
         pattern = validator.get_field_pattern("owner_name")
         assert pattern is None  # No pattern for owner_name
+
+    def test_get_compiled_pattern(self, validator):
+        """Test compiled pattern retrieval."""
+        pattern = validator.get_compiled_pattern("zip_code")
+        assert pattern.match("27601")
+        assert not pattern.match("27601x")
+
+        assert validator.get_compiled_pattern("owner_name") is None